@@ -5,6 +5,7 @@ Dependency injection for MongoDB + SentenceTransformers stack.
 Uses lifespan-scoped singletons for expensive resources.
 """
 
+import asyncio
 import os
 from typing import Annotated, Optional
 
@@ -12,10 +13,14 @@ from dotenv import load_dotenv
 load_dotenv()
 from fastapi import Depends
 
+from etl.embeddings.cache import CachedEmbeddingService
 from etl.embeddings.vector_store import VectorStore
 from etl.repository.dataset_repository import DatasetRepository
 from etl.repository.mongodb import MongoDBConnection, MongoDBConfig
 from etl.repository.user_repository_mongo import UserRepositoryMongo
+from etl.resources import close_http_session
+from etl.search.advanced import CrossEncoderReranker
+from etl.search.cache import SemanticQueryCache
 from etl.search.hybrid import HybridSearchService
 
 # Will be set during app lifespan
@@ -61,6 +66,11 @@ async def init_dependencies():
         from etl.embeddings import SentenceTransformerService
         model_name = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
         _embedding_service = SentenceTransformerService(model_name=model_name)
+
+        # Optional persistent cache of query embeddings across restarts
+        cache_path = os.getenv("EMBEDDING_CACHE_PATH")
+        if cache_path:
+            _embedding_service = CachedEmbeddingService(_embedding_service, cache_path)
     except Exception as e:
         print(f"Warning: Failed to init embedding service: {e}")
         _embedding_service = None
@@ -76,13 +86,28 @@ async def init_dependencies():
             print(f"Warning: Failed to init vector store: {e}")
             _vector_store = None
 
-    # Hybrid search
+    # Hybrid search, with an opt-in response cache. Only this process's
+    # admin/upload endpoints clear it; writes from other processes (CLI
+    # runs, bulk import, migrations) are not seen until entries expire.
     if _vector_store and _dataset_repo:
+        search_cache = None
+        cache_ttl = os.getenv("SEARCH_CACHE_TTL")
+        if cache_ttl:
+            search_cache = SemanticQueryCache(ttl_seconds=float(cache_ttl))
         _hybrid_search = HybridSearchService(
             vector_store=_vector_store,
             repository=_dataset_repo,
+            cache=search_cache,
         )
 
+    # Cross-encoder reranker (opt-in): load the shared model and run one
+    # inference now so the first advanced search doesn't pay for it
+    if os.getenv("RERANKER_WARMUP", "false").lower() == "true":
+        try:
+            await asyncio.to_thread(CrossEncoderReranker().warmup)
+        except Exception as e:
+            print(f"Warning: Failed to warm up reranker: {e}")
+
 
 async def shutdown_dependencies():
     """
@@ -94,6 +119,10 @@ async def shutdown_dependencies():
 
     _hybrid_search = None
     _vector_store = None
+
+    # Persistent embedding cache holds an open SQLite connection
+    if isinstance(_embedding_service, CachedEmbeddingService):
+        _embedding_service.close()
     _embedding_service = None
     _dataset_repo = None
     _user_repo = None
@@ -102,6 +131,8 @@ async def shutdown_dependencies():
         await _mongo_conn.close()
         _mongo_conn = None
 
+    await close_http_session()
+
 
 # =============================================================================
 # Dependency Getters
@@ -129,6 +160,12 @@ def get_hybrid_search() -> Optional[HybridSearchService]:
     return _hybrid_search
 
 
+def invalidate_search_cache() -> None:
+    """Drop cached search responses after the catalogue changes."""
+    if _hybrid_search is not None and _hybrid_search.cache is not None:
+        _hybrid_search.cache.clear()
+
+
 def get_user_repository() -> UserRepositoryMongo:
     """Get user repository instance."""
     if _user_repo is None:
@@ -173,7 +210,7 @@ async def get_service_status() -> dict:
 
     if _dataset_repo:
         try:
-            status["dataset_count"] = await _dataset_repo.count()
+            status["dataset_count"] = await _dataset_repo.count_approx()
         except Exception:
             pass
 
@@ -14,7 +14,12 @@ from motor.motor_asyncio import AsyncIOMotorGridFSBucket
 from pydantic import BaseModel
 
 from api.auth.dependencies import AdminUser
-from api.dependencies import get_dataset_repository, get_embedding_service, get_mongo_connection
+from api.dependencies import (
+    get_dataset_repository,
+    get_embedding_service,
+    get_mongo_connection,
+    invalidate_search_cache,
+)
 from api.schemas.responses import ComplianceInfo
 from etl.extraction.metadata_extractor import MetadataExtractor
 from etl.models.dataset import DatasetMetadata
@@ -390,6 +395,9 @@ async def bulk_upload(
         except Exception as e:
             errors.append(f"Row {i + 1}: {e}")
 
+    if imported:
+        invalidate_search_cache()
+
     return BulkUploadResponse(
         success=imported > 0,
         message=f"Imported {imported} of {len(datasets)} dataset(s)",
@@ -428,6 +436,8 @@ async def delete_dataset(identifier: str, user: AdminUser):
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Dataset not found")
 
+    invalidate_search_cache()
+
     return {"success": True, "message": f"Deleted dataset: {identifier}"}
 
 
@@ -548,6 +558,8 @@ async def approve_pending(pending_id: str, user: AdminUser):
     # Remove from pending
     await conn.pending.delete_one({"_id": oid})
 
+    invalidate_search_cache()
+
     return {
         "message": "Dataset approved",
         "identifier": identifier,
@@ -17,6 +17,7 @@ from api.dependencies import (
     get_dataset_repository,
     get_embedding_service,
     get_mongo_connection,
+    invalidate_search_cache,
 )
 from api.schemas.responses import UploadResponse
 from etl.models.dataset import DatasetMetadata
@@ -179,6 +180,8 @@ async def upload_document(
             # Store succeeded, embedding failed - not fatal
             print(f"Warning: embedding failed for {identifier}: {e}")
 
+    invalidate_search_cache()
+
     return UploadResponse(
         identifier=identifier,
         title=title,
@@ -62,6 +62,7 @@ def cmd_run(ids_file: str = "data/metadata-file-identifiers.txt"):
     from etl.parsers import get_default_registry
     from etl.repository import MongoDBConnection, DatasetRepository
     from etl.pipeline import ETLPipeline, PipelineConfig, create_console_progress
+    from etl.resources import close_http_session
 
     # Load IDs
     dataset_ids = load_dataset_ids(ids_file)
@@ -74,32 +75,35 @@ def cmd_run(ids_file: str = "data/metadata-file-identifiers.txt"):
         conn = MongoDBConnection()
         await conn.connect()
 
-        repo = DatasetRepository(conn.datasets)
-
-        client = CEHCatalogueClient(
-            cache_dir=cache_dir,
-            cache_ttl=timedelta(hours=24),
-            concurrency=3,
-            request_delay=0.3,
-        )
+        try:
+            repo = DatasetRepository(conn.datasets)
 
-        pipeline = ETLPipeline(
-            client=client,
-            parser_registry=get_default_registry(),
-            repository=repo,
-            config=PipelineConfig(batch_size=20),
-        )
+            client = CEHCatalogueClient(
+                cache_dir=cache_dir,
+                cache_ttl=timedelta(hours=24),
+                concurrency=3,
+                request_delay=0.3,
+            )
 
-        print("Starting ETL pipeline...")
-        print()
+            pipeline = ETLPipeline(
+                client=client,
+                parser_registry=get_default_registry(),
+                repository=repo,
+                config=PipelineConfig(batch_size=20),
+            )
 
-        result = await pipeline.run(
-            dataset_ids,
-            progress_callback=create_console_progress(),
-        )
+            print("Starting ETL pipeline...")
+            print()
 
-        await conn.close()
-        return result
+            return await pipeline.run(
+                dataset_ids,
+                progress_callback=create_console_progress(),
+            )
+        finally:
+            # The pooled HTTP session is bound to this loop; close it
+            # before asyncio.run() tears the loop down
+            await close_http_session()
+            await conn.close()
 
     result = asyncio.run(run_pipeline())
 
@@ -34,6 +34,7 @@ from etl.resources import (
     CEHCatalogueResource,
     CEHSupportingDocsResource,
     CachedResource,
+    close_http_session,
 )
 from etl.resources.base import FetchResult
 
@@ -530,4 +531,7 @@ async def fetch_datasets(
     )
 
     callback = create_console_progress() if show_progress else None
-    return await client.fetch_all(dataset_ids, progress_callback=callback)
\ No newline at end of file
+    try:
+        return await client.fetch_all(dataset_ids, progress_callback=callback)
+    finally:
+        await close_http_session()
\ No newline at end of file
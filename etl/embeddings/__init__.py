@@ -3,6 +3,7 @@ Embedding services for generating vector representations of text.
 """
 
 from .base import EmbeddingService
+from .cache import CachedEmbeddingService
 from .sentence_transformer_service import SentenceTransformerService
 from .vector_store import (
     VectorStore,
@@ -13,6 +14,7 @@ from .vector_store import (
 
 __all__ = [
     "EmbeddingService",
+    "CachedEmbeddingService",
     "SentenceTransformerService",
     "VectorStore",
     "SearchResult",
@@ -0,0 +1,110 @@
+"""
+Persistent embedding cache.
+
+Wraps any EmbeddingService so query embeddings survive process restarts:
+a recurring query is read back from a local SQLite file instead of being
+re-encoded by the model.
+
+Vectors are stored as float16 bytes (half the size of float32, well
+within the precision cosine search needs) and keyed by
+sha256(model_name + text), so entries from different models never mix.
+
+Usage:
+    service = CachedEmbeddingService(
+        SentenceTransformerService(),
+        path="data/cache/embeddings.sqlite",
+    )
+    vector = await service.embed_query("river water quality")
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from .base import EmbeddingService
+
+
+class CachedEmbeddingService(EmbeddingService):
+    """EmbeddingService decorator with a SQLite-backed query cache."""
+
+    MMAP_SIZE = 64 * 1024 * 1024
+
+    def __init__(self, service: EmbeddingService, path: str | Path):
+        self._service = service
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        # Reads come straight from a memory map of the file; WAL keeps the
+        # per-insert commit from fsyncing the whole database
+        self._conn.execute(f"PRAGMA mmap_size = {self.MMAP_SIZE}")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " key BLOB PRIMARY KEY, model TEXT NOT NULL,"
+            " dim INTEGER NOT NULL, vec BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def model_name(self) -> str:
+        return self._service.model_name
+
+    @property
+    def dimensions(self) -> int:
+        return self._service.dimensions
+
+    async def embed_query(self, text: str) -> List[float]:
+        """Embed a query, reading from / writing to the persistent cache."""
+        # SQLite calls block, so they run on a worker thread off the loop
+        key = self._key(text)
+        cached = await asyncio.to_thread(self._get, key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        embedding = await self._service.embed_query(text)
+        await asyncio.to_thread(self._put, key, embedding)
+        return embedding
+
+    async def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch (indexing path; not cached)."""
+        return await self._service.embed_batch(texts)
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.sha256(f"{self.model_name}:{text}".encode()).digest()
+
+    def _get(self, key: bytes) -> Optional[List[float]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT vec FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.float16).astype(np.float32).tolist()
+
+    def _put(self, key: bytes, embedding: List[float]) -> None:
+        vec = np.asarray(embedding, dtype=np.float16)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, model, dim, vec)"
+                " VALUES (?, ?, ?, ?)",
+                (key, self.model_name, vec.shape[0], vec.tobytes()),
+            )
+            self._conn.commit()
@@ -35,7 +35,7 @@ from etl.models.dataset import DatasetMetadata
 from .base import EmbeddingService
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """A semantic search result."""
     dataset_id: str
@@ -183,6 +183,7 @@ class VectorStore:
         query: str,
         limit: int = 10,
         min_score: float = 0.0,
+        query_embedding: Optional[list[float]] = None,
     ) -> list[SearchResult]:
         """
         Semantic search using MongoDB Atlas $vectorSearch.
@@ -191,8 +192,10 @@ class VectorStore:
             query: Search query
             limit: Maximum results
             min_score: Minimum similarity (0-1)
+            query_embedding: Precomputed embedding of query (skips embedding)
         """
-        query_embedding = await self.embedding_service.embed_query(query)
+        if query_embedding is None:
+            query_embedding = await self.embedding_service.embed_query(query)
 
         pipeline = [
             {
@@ -678,6 +678,14 @@ class DatasetMetadata(BaseModel):
                 return party
         return None
 
+    @property
+    def organisation(self) -> str | None:
+        """Get the first organisation named by a responsible party."""
+        for party in self.responsible_parties:
+            if party.organisation:
+                return party.organisation
+        return None
+
     @property
     def search_text(self) -> str:
         """
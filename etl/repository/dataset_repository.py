@@ -115,6 +115,15 @@ class DatasetRepository:
         """Count total datasets."""
         return await self._collection.count_documents({})
 
+    async def count_approx(self) -> int:
+        """
+        Approximate dataset count from collection metadata.
+
+        O(1) - avoids the collection scan of count(). Suitable for
+        dashboards and health checks that poll frequently.
+        """
+        return await self._collection.estimated_document_count()
+
     # =========================================================================
     # Search Operations
     # =========================================================================
@@ -32,9 +32,13 @@ class MongoDBConfig:
         self,
         uri: Optional[str] = None,
         database_name: Optional[str] = None,
+        read_preference: Optional[str] = None,
     ):
         self.uri = uri or os.getenv("MONGODB_URI", "mongodb://localhost:27017")
         self.database_name = database_name or os.getenv("MONGODB_DATABASE", "dsh_etl_search")
+        # e.g. "secondaryPreferred" to serve reads from replica set secondaries
+        # while writes stay on the primary. None keeps the driver default.
+        self.read_preference = read_preference or os.getenv("MONGODB_READ_PREFERENCE")
 
 
 class MongoDBConnection:
@@ -52,7 +56,10 @@ class MongoDBConnection:
 
     async def connect(self) -> None:
         """Connect to MongoDB."""
-        self._client = AsyncIOMotorClient(self.config.uri)
+        options = {}
+        if self.config.read_preference:
+            options["readPreference"] = self.config.read_preference
+        self._client = AsyncIOMotorClient(self.config.uri, **options)
         self._db = self._client[self.config.database_name]
         # Verify connection
         await self._client.admin.command("ping")
@@ -41,12 +41,14 @@ from .http import (
     CEHCatalogueResource,
     CEHSupportingDocsResource,
     HttpResource,
+    close_http_session,
 )
 
 # Local resources
 from .local import (
     LocalFileResource,
     ZipEntryResource,
+    close_zip_handles,
     extract_zip_to_directory,
 )
 
@@ -55,12 +57,14 @@ from .cached import (
     CachedResource,
     cache_stats,
     clear_cache,
+    migrate_shard_depth,
 )
 
 # Factory
 from .factory import (
     ResourceFactory,
     configure_default_factory,
+    fetch_many,
     get_default_factory,
 )
 
@@ -75,16 +79,20 @@ __all__ = [
     "CEHCatalogueResource",
     "CEHSupportingDocsResource",
     "HttpResource",
+    "close_http_session",
     # Local
     "LocalFileResource",
     "ZipEntryResource",
+    "close_zip_handles",
     "extract_zip_to_directory",
     # Caching
     "CachedResource",
     "cache_stats",
     "clear_cache",
+    "migrate_shard_depth",
     # Factory
     "ResourceFactory",
     "configure_default_factory",
+    "fetch_many",
     "get_default_factory",
 ]
\ No newline at end of file
@@ -17,10 +17,16 @@ SOLID Principles:
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntFlag
+from functools import lru_cache
 from pathlib import Path
 from typing import AsyncIterator, Optional
 import hashlib
+import sys
+
+
+# Default stream() chunk size: 64 KiB, a multiple of the 4 KiB page size
+DEFAULT_CHUNK_SIZE = 64 * 1024
 
 
 class ResourceType(str, Enum):
@@ -31,7 +37,36 @@ class ResourceType(str, Enum):
     CACHED = "cached"
 
 
-@dataclass
+class _MimeKind(IntFlag):
+    """Content type classification bits."""
+    JSON = 1
+    XML = 2
+    TEXT = 4
+
+
+@lru_cache(maxsize=256)
+def _classify_content_type(content_type: Optional[str]) -> _MimeKind:
+    """
+    Classify a MIME type once; later checks are a single dict lookup.
+
+    Only a handful of distinct content types occur in practice, so the
+    memo stays tiny while sparing per-call lowercasing and scanning.
+    """
+    kind = _MimeKind(0)
+    if not content_type:
+        return kind
+
+    ct = content_type.lower()
+    if "json" in ct:
+        kind |= _MimeKind.JSON
+    if "xml" in ct or "gemini" in ct:
+        kind |= _MimeKind.XML
+    if ct.startswith("text/"):
+        kind |= _MimeKind.TEXT
+    return kind
+
+
+@dataclass(slots=True)
 class ResourceMetadata:
     """
     Metadata about a resource.
@@ -56,27 +91,20 @@ class ResourceMetadata:
     @property
     def is_json(self) -> bool:
         """Check if content type indicates JSON."""
-        if not self.content_type:
-            return False
-        return "json" in self.content_type.lower()
+        return bool(_classify_content_type(self.content_type) & _MimeKind.JSON)
 
     @property
     def is_xml(self) -> bool:
         """Check if content type indicates XML."""
-        if not self.content_type:
-            return False
-        ct = self.content_type.lower()
-        return "xml" in ct or "gemini" in ct
+        return bool(_classify_content_type(self.content_type) & _MimeKind.XML)
 
     @property
     def is_text(self) -> bool:
         """Check if content type indicates text."""
-        if not self.content_type:
-            return False
-        return self.content_type.lower().startswith("text/")
+        return bool(_classify_content_type(self.content_type) & _MimeKind.TEXT)
 
 
-@dataclass
+@dataclass(slots=True)
 class FetchResult:
     """
     Result of fetching a resource.
@@ -89,23 +117,43 @@ class FetchResult:
         success: Whether the fetch succeeded
         error: Error message if fetch failed
         from_cache: Whether content came from cache
+        not_modified: Source answered a conditional request with 304;
+            content is empty and the caller's cached copy is current
+        digest: SHA-256 hex digest of content, if already computed (e.g.
+            incrementally while streaming); see content_hash
     """
     content: bytes
     metadata: ResourceMetadata
     success: bool = True
     error: Optional[str] = None
     from_cache: bool = False
+    not_modified: bool = False
+    digest: Optional[str] = field(default=None, repr=False, compare=False)
+    _text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def text(self) -> str:
-        """Decode content as text using detected or default encoding."""
-        encoding = self.metadata.encoding or "utf-8"
-        return self.content.decode(encoding)
+        """
+        Decode content as text using detected or default encoding.
+
+        Decoded once and kept; undecodable bytes are replaced, not raised.
+        """
+        if self._text is None:
+            encoding = self.metadata.encoding or "utf-8"
+            self._text = self.content.decode(encoding, errors="replace")
+        return self._text
 
     @property
     def content_hash(self) -> str:
-        """SHA-256 hash of content for change detection."""
-        return hashlib.sha256(self.content).hexdigest()
+        """
+        SHA-256 hash of content for change detection.
+
+        Returns the digest supplied at construction if any, otherwise
+        hashes the content once and keeps the result.
+        """
+        if self.digest is None:
+            self.digest = hashlib.sha256(self.content).hexdigest()
+        return self.digest
 
     @classmethod
     def failure(cls, error: str) -> "FetchResult":
@@ -143,6 +191,9 @@ class Resource(ABC):
             data = json.loads(result.text)
     """
 
+    # Slotted so subclasses that declare __slots__ carry no __dict__
+    __slots__ = ("_identity", "_identity_hash")
+
     # -------------------------------------------------------------------------
     # Abstract Methods (Subclasses Must Implement)
     # -------------------------------------------------------------------------
@@ -257,15 +308,21 @@ class Resource(ABC):
         result = await self.fetch()
         return result.metadata
 
-    async def stream(self, chunk_size: int = 8192) -> AsyncIterator[bytes]:
+    async def stream(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
         """
         Stream resource content in chunks.
 
-        Default implementation fetches all content then yields chunks.
-        Subclasses can override for true streaming.
+        Default implementation fetches all content then yields chunks,
+        so the whole payload is held in memory. Subclasses that can read
+        incrementally (files, cache blobs, HTTP bodies) should override
+        this for true streaming.
 
         Args:
-            chunk_size: Size of each chunk in bytes
+            chunk_size: Size of each chunk in bytes. Defaults to 64 KiB
+                (page aligned); HTTP callers may pass 256 KiB. Values
+                below 4096 defeat page-cache efficiency.
 
         Yields:
             Chunks of content
@@ -283,10 +340,30 @@ class Resource(ABC):
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}({self.identifier})>"
 
+    def _interned_identifier(self) -> str:
+        """
+        Interned identifier and its hash, computed on first use.
+
+        Identifiers are fixed per instance, so dict/set operations keyed
+        on resources reduce to an attribute load and a pointer compare.
+        """
+        try:
+            return self._identity
+        except AttributeError:
+            self._identity = sys.intern(self.identifier)
+            self._identity_hash = hash(self._identity)
+            return self._identity
+
     def __hash__(self) -> int:
-        return hash(self.identifier)
+        try:
+            return self._identity_hash
+        except AttributeError:
+            self._interned_identifier()
+            return self._identity_hash
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Resource):
             return False
-        return self.identifier == other.identifier
\ No newline at end of file
+        mine = self._interned_identifier()
+        theirs = other._interned_identifier()
+        return mine is theirs or mine == theirs
\ No newline at end of file
@@ -6,16 +6,28 @@ The cache is transparent - clients don't need to know if content
 comes from cache or the original source.
 """
 
+import asyncio
 import hashlib
-import json
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import replace
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 import aiofiles
-import aiofiles.os
+import orjson
+
+try:
+    import zstandard
+except ImportError:  # Optional: cached content is then stored uncompressed
+    zstandard = None
 
 from .base import (
+    DEFAULT_CHUNK_SIZE,
     FetchResult,
     Resource,
     ResourceMetadata,
@@ -23,6 +35,111 @@ from .base import (
 )
 
 
+BLOB_SUFFIX = ".blob"
+
+# Key prefix length for shard subdirectories (3 hex chars = 4096 shards)
+DEFAULT_SHARD_HEX_CHARS = 3
+
+# Keys are SHA-256 hex digests, so a shard prefix is 1-64 chars
+_MAX_SHARD_HEX_CHARS = 64
+
+# Size of the little-endian metadata length prefix in each blob
+_HEADER_SIZE = 4
+
+# Payloads at or above this size are written unbuffered in large slices
+_LARGE_WRITE_THRESHOLD = 1024 * 1024
+_WRITE_CHUNK_SIZE = 512 * 1024
+
+# Compression level for cached XML/JSON payloads
+_ZSTD_LEVEL = 1
+
+
+class _CacheKeyBloom:
+    """
+    Bloom filter of cache keys present in one cache directory.
+
+    Lets fetches of never-cached identifiers skip the disk stat entirely.
+    The filter is seeded from a scandir walk in a background thread;
+    until that finishes every key "might" be present, so there are never
+    false negatives - only the usual false positives, which fall through
+    to the normal disk check. Entries written by another process after
+    seeding are not seen and are simply re-fetched.
+    """
+
+    _SIZE_BITS = 1 << 20  # 128 KiB
+    _registry: dict[str, "_CacheKeyBloom"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self):
+        self._bits = bytearray(self._SIZE_BITS // 8)
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        # Set by reset(); resources created earlier still hold this filter
+        self._retired = False
+
+    @classmethod
+    def for_dir(cls, cache_dir: Path) -> "_CacheKeyBloom":
+        """Get the shared filter for cache_dir, seeding it on first use."""
+        dir_key = os.path.abspath(cache_dir)
+        with cls._registry_lock:
+            bloom = cls._registry.get(dir_key)
+            if bloom is None:
+                bloom = cls._registry[dir_key] = cls()
+                threading.Thread(
+                    target=bloom._populate, args=(dir_key,), daemon=True
+                ).start()
+        return bloom
+
+    @classmethod
+    def reset(cls, cache_dir: Path) -> None:
+        """
+        Forget the filter for cache_dir (e.g. after clearing or re-sharding).
+
+        The old filter is retired rather than just dropped: resources that
+        already hold it answer "might contain" for every key from now on.
+        """
+        with cls._registry_lock:
+            bloom = cls._registry.pop(os.path.abspath(cache_dir), None)
+        if bloom is not None:
+            bloom._retired = True
+
+    def _positions(self, key: str) -> tuple[int, int, int]:
+        # The key is a SHA-256 hex digest, so its slices are independent hashes
+        m = self._SIZE_BITS
+        return int(key[0:8], 16) % m, int(key[8:16], 16) % m, int(key[16:24], 16) % m
+
+    def add(self, key: str) -> None:
+        with self._lock:
+            for pos in self._positions(key):
+                self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def might_contain(self, key: str) -> bool:
+        if self._retired or not self._ready.is_set():
+            return True
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key)
+        )
+
+    def _populate(self, cache_dir: str) -> None:
+        try:
+            with os.scandir(cache_dir) as shards:
+                for shard in shards:
+                    if not shard.is_dir():
+                        if shard.name.endswith(BLOB_SUFFIX):
+                            # Unsharded layout the walk doesn't cover;
+                            # marking ready would give false negatives
+                            return
+                        continue
+                    with os.scandir(shard.path) as files:
+                        for entry in files:
+                            if entry.name.endswith(BLOB_SUFFIX):
+                                self.add(entry.name[: -len(BLOB_SUFFIX)])
+        except OSError:
+            # Partial seed could yield false negatives; stay permissive
+            return
+        self._ready.set()
+
+
 class CachedResource(Resource):
     """
     Decorator that adds caching to any Resource.
@@ -37,9 +154,14 @@ class CachedResource(Resource):
 
     The cache is organized by resource identifier hash:
         cache_dir/
-            ab/
-                abc123def456.content   # Raw content
-                abc123def456.meta      # Metadata JSON
+            abc/
+                abc123def456.blob      # Metadata header + raw content
+
+    Blobs are sharded by the first `shard_hex_chars` hex characters of
+    the key (3 by default, i.e. 4096 subdirectories).
+
+    Each blob holds a 4-byte little-endian metadata length, the metadata
+    JSON, then the raw content, so a cache hit is a single file read.
 
     Example:
         # Wrap an HTTP resource with caching
@@ -57,18 +179,31 @@ class CachedResource(Resource):
         result = await cached.fetch()
         assert result.from_cache == True
 
+    Recently written entries are also kept in a process-wide LRU (keyed
+    by blob path) so repeated fetches of a hot resource skip disk IO.
+    Payloads of 1 MiB or more are not held in memory.
+
     Attributes:
         wrapped: The underlying resource being cached
         cache_dir: Directory for cache storage
         ttl: Time-to-live for cache entries
     """
 
+    # blob path -> (monotonic time stored, result); freshness is judged
+    # against the reading instance's TTL, not the writer's
+    _MEM_CACHE: OrderedDict[str, tuple[float, FetchResult]] = OrderedDict()
+    _MEM_CACHE_MAX = 256
+
+    # blob path -> future resolved by the coroutine currently fetching it
+    _INFLIGHT: dict[str, asyncio.Future] = {}
+
     def __init__(
         self,
         wrapped: Resource,
         cache_dir: str | Path,
         ttl: Optional[timedelta] = None,
         use_etag: bool = True,
+        shard_hex_chars: int = DEFAULT_SHARD_HEX_CHARS,
     ):
         """
         Initialize cached resource.
@@ -78,14 +213,28 @@ class CachedResource(Resource):
             cache_dir: Directory for cache storage
             ttl: Time-to-live (None = cache forever)
             use_etag: Whether to use ETag for revalidation
+            shard_hex_chars: Key prefix length used for shard directories
+                (1-64; blobs always live one level below cache_dir)
+
+        Raises:
+            ValueError: If shard_hex_chars is out of range
         """
+        _check_shard_depth(shard_hex_chars)
         self._wrapped = wrapped
         self._cache_dir = Path(cache_dir)
         self._ttl = ttl
         self._use_etag = use_etag
 
-        # Ensure cache directory exists
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        # Identifier is fixed for the wrapped resource, so the key, blob
+        # path and shard directory are computed (and created) once
+        self._key = hashlib.sha256(self._wrapped.identifier.encode()).hexdigest()
+
+        # Shard by key prefix to keep per-directory entry counts small
+        self._subdir = self._cache_dir / self._key[:shard_hex_chars]
+        self._blob_path = self._subdir / f"{self._key}{BLOB_SUFFIX}"
+        self._subdir.mkdir(parents=True, exist_ok=True)
+
+        self._bloom = _CacheKeyBloom.for_dir(self._cache_dir)
 
     @property
     def identifier(self) -> str:
@@ -116,32 +265,115 @@ class CachedResource(Resource):
         """
         Fetch with caching.
 
-        1. Check if valid cache exists
-        2. If yes, return cached content
-        3. If no, fetch from source and cache
+        1. Check the in-process memory cache
+        2. Join an identical fetch already in flight, if any
+        3. Check if valid disk cache exists
+        4. If yes, return cached content
+        5. If no, fetch from source and cache
+        """
+        memo = self._mem_get()
+        if memo is not None:
+            return memo
+
+        # Coalesce concurrent fetches of the same entry: the first caller
+        # does the work, the rest await its result. If it fails, each
+        # waiter retries on its own (the first one becoming the new owner).
+        key = str(self._blob_path)
+        while (pending := CachedResource._INFLIGHT.get(key)) is not None:
+            shared = await asyncio.shield(pending)
+            if shared is not None:
+                return _detached(shared)
+
+        future = asyncio.get_running_loop().create_future()
+        CachedResource._INFLIGHT[key] = future
+        result = None
+        try:
+            result = await self._fetch_through_cache()
+            return result
+        finally:
+            del CachedResource._INFLIGHT[key]
+            future.set_result(result)
+
+    async def _fetch_through_cache(self) -> FetchResult:
         """
-        # Check cache first
-        cached = await self._read_cache()
-        if cached is not None:
-            if await self._is_cache_valid(cached):
-                cached.from_cache = True
-                return cached
+        Serve from a valid disk cache entry, else fetch and cache.
+
+        An expired entry carrying an ETag or Last-Modified is revalidated
+        with a conditional request; on 304 it is re-stamped and served.
+        """
+        # Check cache first - the mtime check skips reading stale entries
+        cached = None
+        can_revalidate = self._use_etag and hasattr(self._wrapped, "with_validators")
+        if await self._may_have_fresh_entry():
+            cached = await self._read_cache()
+            if cached is not None:
+                if await self._is_cache_valid(cached):
+                    cached.from_cache = True
+                    return cached
+        elif can_revalidate and self._bloom.might_contain(self._key):
+            cached = await self._read_cache()
+
+        source = self._wrapped
+        if can_revalidate and cached is not None:
+            etag = cached.metadata.etag
+            last_modified = cached.metadata.last_modified
+            if etag or last_modified:
+                source = self._wrapped.with_validators(etag, last_modified)
 
         # Fetch from source
-        result = await self._wrapped.fetch()
+        result = await source.fetch()
 
-        if result.success:
+        if result.not_modified and cached is not None:
+            await self._write_cache(cached)
+            cached.from_cache = True
+            return cached
+
+        if result.success and not result.not_modified:
             # Store in cache
             await self._write_cache(result)
 
         return result
 
+    async def stream(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream content in chunks.
+
+        A fresh disk cache entry is streamed straight from its blob file
+        without loading the full payload. Otherwise falls back to fetch().
+        """
+        memo = self._mem_get()
+        if memo is None and await self._may_have_fresh_entry():
+            try:
+                async with aiofiles.open(self._cache_path(), "rb") as f:
+                    meta_len = int.from_bytes(await f.read(_HEADER_SIZE), "little")
+                    meta_dict = orjson.loads(await f.read(meta_len))
+
+                    if meta_dict.get("compression") != "zstd":
+                        while chunk := await f.read(chunk_size):
+                            yield chunk
+                        return
+
+                    if zstandard is not None:
+                        decoder = zstandard.ZstdDecompressor().decompressobj()
+                        while chunk := await f.read(chunk_size):
+                            if out := decoder.decompress(chunk):
+                                yield out
+                        return
+            except FileNotFoundError:
+                pass
+
+        async for chunk in super().stream(chunk_size):
+            yield chunk
+
     async def fetch_fresh(self) -> FetchResult:
         """
         Fetch bypassing cache.
 
         Forces a fresh fetch from the source and updates cache.
         """
+        self._mem_discard()
         result = await self._wrapped.fetch()
 
         if result.success:
@@ -156,61 +388,87 @@ class CachedResource(Resource):
         Returns:
             True if cache was deleted, False if no cache existed
         """
-        content_path, meta_path = self._cache_paths()
+        self._mem_discard()
+
+        # A single local unlink is cheaper inline than via the threadpool
+        try:
+            os.remove(self._cache_path())
+        except FileNotFoundError:
+            return False
+        return True
+
+    # -------------------------------------------------------------------------
+    # In-Process Memory Cache
+    # -------------------------------------------------------------------------
 
-        deleted = False
+    def _mem_get(self) -> Optional[FetchResult]:
+        """Return a copy of the memoized result if present and unexpired."""
+        key = str(self._blob_path)
+        entry = CachedResource._MEM_CACHE.get(key)
+        if entry is None:
+            return None
+
+        stored_at, result = entry
+        if (
+            self._ttl is not None
+            and time.monotonic() - stored_at > self._ttl.total_seconds()
+        ):
+            del CachedResource._MEM_CACHE[key]
+            return None
+
+        CachedResource._MEM_CACHE.move_to_end(key)
+        return _detached(result, from_cache=True)
 
-        if await aiofiles.os.path.exists(content_path):
-            await aiofiles.os.remove(content_path)
-            deleted = True
+    def _mem_put(self, result: FetchResult) -> None:
+        """Memoize a result, evicting the least recently used entries."""
+        if len(result.content) >= _LARGE_WRITE_THRESHOLD:
+            return
 
-        if await aiofiles.os.path.exists(meta_path):
-            await aiofiles.os.remove(meta_path)
-            deleted = True
+        key = str(self._blob_path)
+        CachedResource._MEM_CACHE[key] = (time.monotonic(), _detached(result))
+        CachedResource._MEM_CACHE.move_to_end(key)
 
-        return deleted
+        while len(CachedResource._MEM_CACHE) > CachedResource._MEM_CACHE_MAX:
+            CachedResource._MEM_CACHE.popitem(last=False)
+
+    def _mem_discard(self) -> None:
+        """Drop this resource from the memory cache."""
+        CachedResource._MEM_CACHE.pop(str(self._blob_path), None)
 
     # -------------------------------------------------------------------------
     # Cache Management
     # -------------------------------------------------------------------------
 
     def _cache_key(self) -> str:
-        """Generate cache key from identifier."""
-        return hashlib.sha256(self.identifier.encode()).hexdigest()
-
-    def _cache_paths(self) -> tuple[Path, Path]:
-        """Get paths for cache content and metadata files."""
-        key = self._cache_key()
-
-        # Use first 2 chars as subdirectory for better filesystem performance
-        subdir = self._cache_dir / key[:2]
-
-        content_path = subdir / f"{key}.content"
-        meta_path = subdir / f"{key}.meta"
+        """Cache key derived from identifier."""
+        return self._key
 
-        return content_path, meta_path
+    def _cache_path(self) -> Path:
+        """Get path of the cache blob file."""
+        return self._blob_path
 
     async def _cache_exists(self) -> bool:
-        """Check if cache files exist."""
-        content_path, meta_path = self._cache_paths()
-        return (
-            await aiofiles.os.path.exists(content_path) and
-            await aiofiles.os.path.exists(meta_path)
-        )
+        """
+        Check if cache blob exists.
+
+        Runs the stat inline - O(µs) - rather than through the threadpool.
+        """
+        return os.path.exists(self._cache_path())
 
     async def _read_cache(self) -> Optional[FetchResult]:
         """Read cached content and metadata."""
-        content_path, meta_path = self._cache_paths()
+        blob_path = self._cache_path()
 
         try:
-            # Read metadata
-            async with aiofiles.open(meta_path, "r") as f:
-                meta_json = await f.read()
-            meta_dict = json.loads(meta_json)
+            async with aiofiles.open(blob_path, "rb") as f:
+                blob = await f.read()
 
-            # Read content
-            async with aiofiles.open(content_path, "rb") as f:
-                content = await f.read()
+            meta_dict, content = _unpack_blob(blob)
+
+            if meta_dict.get("compression") == "zstd":
+                if zstandard is None:
+                    return None
+                content = zstandard.ZstdDecompressor().decompress(content)
 
             # Reconstruct metadata
             metadata = ResourceMetadata(
@@ -225,6 +483,7 @@ class CachedResource(Resource):
 
             # Add cache metadata
             metadata.extra["cached_at"] = meta_dict.get("cached_at")
+            metadata.extra["cached_at_ts"] = meta_dict.get("cached_at_ts")
             metadata.extra["cache_key"] = self._cache_key()
 
             return FetchResult(
@@ -232,21 +491,19 @@ class CachedResource(Resource):
                 metadata=metadata,
                 success=True,
                 from_cache=True,
+                digest=meta_dict.get("digest"),
             )
 
-        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        except (FileNotFoundError, orjson.JSONDecodeError, KeyError, ValueError):
             return None
+        except Exception as e:
+            if zstandard is not None and isinstance(e, zstandard.ZstdError):
+                return None
+            raise
 
     async def _write_cache(self, result: FetchResult) -> None:
-        """Write content and metadata to cache."""
-        content_path, meta_path = self._cache_paths()
-
-        # Ensure subdirectory exists
-        content_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write content
-        async with aiofiles.open(content_path, "wb") as f:
-            await f.write(result.content)
+        """Write content and metadata to cache as a single blob."""
+        blob_path = self._cache_path()
 
         # Build metadata dict
         meta_dict = {
@@ -258,21 +515,74 @@ class CachedResource(Resource):
             "encoding": result.metadata.encoding,
             "extra": result.metadata.extra,
             "cached_at": datetime.utcnow().isoformat(),
+            "cached_at_ts": int(time.time()),
+            # Only persisted if already known; never forces a hash pass
+            "digest": result.digest,
             "identifier": self.identifier,
         }
 
-        # Write metadata
-        async with aiofiles.open(meta_path, "w") as f:
-            await f.write(json.dumps(meta_dict, indent=2))
+        # XML/JSON compress several-fold and zstd level 1 decodes faster
+        # than the disk read it saves
+        payload = result.content
+        if zstandard is not None and (result.metadata.is_json or result.metadata.is_xml):
+            payload = await _zstd_compress(payload)
+            meta_dict["compression"] = "zstd"
+
+        meta_bytes = orjson.dumps(meta_dict, option=orjson.OPT_NON_STR_KEYS)
+        header = len(meta_bytes).to_bytes(_HEADER_SIZE, "little")
+
+        try:
+            await self._write_blob(header + meta_bytes, payload)
+        except FileNotFoundError:
+            # Shard directory was removed since __init__ (e.g. clear_cache)
+            self._subdir.mkdir(parents=True, exist_ok=True)
+            await self._write_blob(header + meta_bytes, payload)
+
+        # Pin mtime to the fetch time so TTL checks can rely on it
+        now = time.time()
+        os.utime(blob_path, (now, now))
+
+        self._bloom.add(self._key)
+        self._mem_put(result)
+
+    async def _write_blob(self, prefix: bytes, content: bytes) -> None:
+        """Write the blob, choosing the unbuffered path for large payloads."""
+        if len(content) >= _LARGE_WRITE_THRESHOLD:
+            await asyncio.to_thread(
+                _write_blob_unbuffered, self._blob_path, prefix, content
+            )
+        else:
+            async with aiofiles.open(self._blob_path, "wb") as f:
+                await f.write(prefix + content)
+
+    async def _may_have_fresh_entry(self) -> bool:
+        """Bloom-filter then mtime check for a usable disk cache entry."""
+        if not self._bloom.might_contain(self._key):
+            return False
+        return await self._is_fresh_by_mtime(self._cache_path())
+
+    async def _is_fresh_by_mtime(self, path: Path) -> bool:
+        """
+        Check whether a cache file exists and is within TTL by its mtime.
+
+        Lets expired entries be skipped without reading their content.
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return False
+
+        if self._ttl is None:
+            return True
+        return time.time() - stat.st_mtime <= self._ttl.total_seconds()
 
     async def _is_cache_valid(self, cached: FetchResult) -> bool:
         """Check if cached content is still valid."""
         # Check TTL
         if self._ttl is not None:
-            cached_at_str = cached.metadata.extra.get("cached_at")
-            if cached_at_str:
-                cached_at = datetime.fromisoformat(cached_at_str)
-                if datetime.utcnow() - cached_at > self._ttl:
+            cached_at_ts = cached.metadata.extra.get("cached_at_ts")
+            if cached_at_ts is not None:
+                if time.time() - cached_at_ts > self._ttl.total_seconds():
                     return False
 
         # ETag revalidation could be added here
@@ -291,20 +601,23 @@ class CachedResource(Resource):
         Returns:
             Dict with cache status and metadata
         """
-        content_path, meta_path = self._cache_paths()
+        blob_path = self._cache_path()
 
-        if not await aiofiles.os.path.exists(meta_path):
+        if not os.path.exists(blob_path):
             return {"cached": False}
 
         try:
-            async with aiofiles.open(meta_path, "r") as f:
-                meta_dict = json.loads(await f.read())
+            # Only the metadata header is needed, not the content
+            async with aiofiles.open(blob_path, "rb") as f:
+                meta_len = int.from_bytes(await f.read(_HEADER_SIZE), "little")
+                meta_dict = orjson.loads(await f.read(meta_len))
 
             cached_at = datetime.fromisoformat(meta_dict["cached_at"])
 
             is_valid = True
             if self._ttl is not None:
-                is_valid = datetime.utcnow() - cached_at <= self._ttl
+                age = time.time() - meta_dict["cached_at_ts"]
+                is_valid = age <= self._ttl.total_seconds()
 
             return {
                 "cached": True,
@@ -319,6 +632,154 @@ class CachedResource(Resource):
             return {"cached": False, "error": "Failed to read cache metadata"}
 
 
+def _check_shard_depth(depth: int) -> None:
+    """
+    Reject shard depths the cache walkers can't see.
+
+    Clearing, stats and migration only look one directory level down, so
+    an unsharded (depth 0) layout would hide its blobs from them.
+    """
+    if not 1 <= depth <= _MAX_SHARD_HEX_CHARS:
+        raise ValueError(
+            f"Shard depth must be between 1 and {_MAX_SHARD_HEX_CHARS}, got {depth}"
+        )
+
+
+def _detached(result: FetchResult, **changes) -> FetchResult:
+    """Copy result with its own metadata.extra dict (memo entries stay private)."""
+    metadata = replace(result.metadata, extra=dict(result.metadata.extra))
+    return replace(result, metadata=metadata, **changes)
+
+
+async def _zstd_compress(content: bytes) -> bytes:
+    """Compress with zstd level 1, off the event loop for large payloads."""
+    compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+    if len(content) >= _LARGE_WRITE_THRESHOLD:
+        return await asyncio.to_thread(compressor.compress, content)
+    return compressor.compress(content)
+
+
+def _write_blob_unbuffered(path: Path, prefix: bytes, content: bytes) -> None:
+    """
+    Write a large blob without userspace buffering.
+
+    Content is written straight from a memoryview in fixed-size slices,
+    avoiding both the header+content concatenation copy and the
+    buffered-IO copy for megabyte-scale payloads.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    with os.fdopen(fd, "wb", buffering=0) as f:
+        for data in (memoryview(prefix), memoryview(content)):
+            offset = 0
+            while offset < len(data):
+                end = min(offset + _WRITE_CHUNK_SIZE, len(data))
+                offset += f.write(data[offset:end])
+
+
+def _unpack_blob(blob: bytes) -> tuple[dict, bytes]:
+    """Split a cache blob into its metadata dict and raw content."""
+    if len(blob) < _HEADER_SIZE:
+        raise ValueError("Truncated cache blob")
+
+    meta_end = _HEADER_SIZE + int.from_bytes(blob[:_HEADER_SIZE], "little")
+    if meta_end > len(blob):
+        raise ValueError("Truncated cache blob")
+
+    meta_dict = orjson.loads(memoryview(blob)[_HEADER_SIZE:meta_end])
+    return meta_dict, blob[meta_end:]
+
+
+def _clear_sync(cache_dir: Path) -> int:
+    """Delete all cache shards under cache_dir; returns files removed."""
+    count = 0
+    with os.scandir(cache_dir) as shards:
+        shard_paths = [shard.path for shard in shards if shard.is_dir()]
+
+    for shard_path in shard_paths:
+        with os.scandir(shard_path) as files:
+            count += sum(1 for _ in files)
+        shutil.rmtree(shard_path)
+    return count
+
+
+def _walk_sync(cache_dir: Path) -> tuple[int, int]:
+    """Count cache blobs and their total size under cache_dir."""
+    entries = 0
+    total_bytes = 0
+    with os.scandir(cache_dir) as shards:
+        for shard in shards:
+            if not shard.is_dir():
+                continue
+            with os.scandir(shard.path) as files:
+                for entry in files:
+                    if entry.name.endswith(BLOB_SUFFIX):
+                        entries += 1
+                        total_bytes += entry.stat().st_size
+    return entries, total_bytes
+
+
+def _migrate_sync(old_dir: Path, new_dir: Path, new_depth: int) -> int:
+    """Move every blob under old_dir into new_depth shards under new_dir."""
+    moved = 0
+    with os.scandir(old_dir) as shards:
+        shard_paths = [shard.path for shard in shards if shard.is_dir()]
+
+    for shard_path in shard_paths:
+        with os.scandir(shard_path) as files:
+            blobs = [entry for entry in files if entry.name.endswith(BLOB_SUFFIX)]
+        for entry in blobs:
+            target_dir = new_dir / entry.name[:new_depth]
+            target_dir.mkdir(parents=True, exist_ok=True)
+            target = target_dir / entry.name
+            if Path(entry.path) != target:
+                os.replace(entry.path, target)
+                moved += 1
+        # Remove shards emptied by the move
+        try:
+            os.rmdir(shard_path)
+        except OSError:
+            pass
+
+    return moved
+
+
+async def migrate_shard_depth(
+    old_dir: str | Path,
+    new_dir: str | Path,
+    new_depth: int = DEFAULT_SHARD_HEX_CHARS,
+) -> int:
+    """
+    Re-shard an existing cache to a different subdirectory depth.
+
+    Args:
+        old_dir: Existing cache directory
+        new_dir: Target cache directory (may be the same as old_dir)
+        new_depth: Key prefix length for the new shard directories (1-64)
+
+    Returns:
+        Number of cache entries moved
+
+    Raises:
+        ValueError: If new_depth is out of range
+    """
+    _check_shard_depth(new_depth)
+    old_dir = Path(old_dir)
+    new_dir = Path(new_dir)
+
+    CachedResource._MEM_CACHE.clear()
+
+    if not old_dir.exists():
+        return 0
+
+    new_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        return await asyncio.to_thread(_migrate_sync, old_dir, new_dir, new_depth)
+    finally:
+        # Entries moved in were never added to the target's filter
+        _CacheKeyBloom.reset(old_dir)
+        _CacheKeyBloom.reset(new_dir)
+
+
 async def clear_cache(cache_dir: str | Path) -> int:
     """
     Clear all cached content.
@@ -329,22 +790,16 @@ async def clear_cache(cache_dir: str | Path) -> int:
     Returns:
         Number of cache entries deleted
     """
-    import shutil
-
     cache_dir = Path(cache_dir)
 
+    CachedResource._MEM_CACHE.clear()
+    _CacheKeyBloom.reset(cache_dir)
+
     if not cache_dir.exists():
         return 0
 
-    count = 0
-    for subdir in cache_dir.iterdir():
-        if subdir.is_dir():
-            for file in subdir.iterdir():
-                file.unlink()
-                count += 1
-            subdir.rmdir()
-
-    return count // 2  # Two files per entry (content + meta)
+    # One worker thread for the whole walk rather than blocking the loop
+    return await asyncio.to_thread(_clear_sync, cache_dir)
 
 
 async def cache_stats(cache_dir: str | Path) -> dict:
@@ -362,19 +817,11 @@ async def cache_stats(cache_dir: str | Path) -> dict:
     if not cache_dir.exists():
         return {"entries": 0, "total_bytes": 0}
 
-    entries = 0
-    total_bytes = 0
-
-    for subdir in cache_dir.iterdir():
-        if subdir.is_dir():
-            for file in subdir.iterdir():
-                if file.suffix == ".content":
-                    entries += 1
-                    stat = await aiofiles.os.stat(file)
-                    total_bytes += stat.st_size
+    # A single scandir walk in one thread instead of an awaited stat per file
+    entries, total_bytes = await asyncio.to_thread(_walk_sync, cache_dir)
 
     return {
         "entries": entries,
         "total_bytes": total_bytes,
         "total_mb": round(total_bytes / (1024 * 1024), 2),
-    }
\ No newline at end of file
+    }
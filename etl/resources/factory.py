@@ -5,12 +5,16 @@ Creates appropriate Resource instances based on URL/path patterns.
 Implements the Factory pattern for resource creation.
 """
 
+import asyncio
+import re
+import threading
 from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urlparse
+from typing import Iterable, Optional
+from urllib.parse import SplitResult, parse_qs, urlsplit
 
-from .base import Resource
+from .base import FetchResult, Resource
 from .cached import CachedResource
 from .http import (
     CEHCatalogueResource,
@@ -20,6 +24,20 @@ from .http import (
 from .local import LocalFileResource, ZipEntryResource
 
 
+# Dataset IDs in CEH URLs are canonical UUIDs
+_UUID_PATTERN = r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+_UUID_RE = re.compile(_UUID_PATTERN, re.IGNORECASE)
+
+# Supporting docs archives live at /sd/{uuid}.zip
+_ZIP_UUID_RE = re.compile(rf"/({_UUID_PATTERN})\.zip$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _cached_urlsplit(url: str) -> SplitResult:
+    """Memoized urlsplit - ETL batches create resources for repeat URLs."""
+    return urlsplit(url)
+
+
 class ResourceFactory:
     """
     Factory for creating Resource instances.
@@ -44,8 +62,20 @@ class ResourceFactory:
 
         # Creates ZipEntryResource
         resource = factory.create("zip://./archive.zip#readme.txt")
+
+        # Fetch many resources with overlapping network waits
+        results = await fetch_many(factory.create(u) for u in urls)
     """
 
+    __slots__ = (
+        "_cache_dir",
+        "_cache_ttl",
+        "_enable_caching",
+        "_default_timeout",
+        "_scheme_handlers",
+        "_ceh_host_routes",
+    )
+
     def __init__(
         self,
         cache_dir: Optional[str | Path] = None,
@@ -67,6 +97,21 @@ class ResourceFactory:
         self._enable_caching = enable_caching and cache_dir is not None
         self._default_timeout = default_timeout
 
+        # URL scheme -> builder; every builder takes (url, parsed, **kwargs)
+        self._scheme_handlers = {
+            "http": self._create_http,
+            "https": self._create_http,
+            "file": self._create_file_url,
+            "zip": self._create_zip,
+            "": self._create_local,
+        }
+
+        # CEH host -> (path prefix, builder) for specialised HTTP resources
+        self._ceh_host_routes = {
+            "catalogue.ceh.ac.uk": ("", self._create_ceh_resource),
+            "data-package.ceh.ac.uk": ("/sd", self._create_ceh_supporting_docs),
+        }
+
     def create(
         self,
         url_or_path: str,
@@ -84,42 +129,43 @@ class ResourceFactory:
         Returns:
             Appropriate Resource instance
         """
-        # Parse the URL/path
-        parsed = urlparse(url_or_path)
+        # Parse the URL/path once; helpers reuse the result
+        parsed = _cached_urlsplit(url_or_path)
 
         # Determine resource type and create
-        if parsed.scheme in ("http", "https"):
-            resource = self._create_http(url_or_path, **kwargs)
-        elif parsed.scheme == "file":
-            resource = LocalFileResource(parsed.path)
-        elif parsed.scheme == "zip":
-            resource = self._create_zip(parsed, **kwargs)
-        elif parsed.scheme == "":
-            # No scheme - treat as local path
-            resource = LocalFileResource(url_or_path)
-        else:
+        handler = self._scheme_handlers.get(parsed.scheme)
+        if handler is None:
             raise ValueError(f"Unsupported URL scheme: {parsed.scheme}")
+        resource = handler(url_or_path, parsed, **kwargs)
 
-        # Wrap with caching if enabled
-        should_cache = cache if cache is not None else self._enable_caching
+        return self._maybe_cache(resource, cache)
+
+    def _maybe_cache(
+        self, resource: Resource, cache: Optional[bool] = None
+    ) -> Resource:
+        """Wrap with CachedResource if caching applies (cache overrides default)."""
+        should_cache = self._enable_caching if cache is None else cache
         if should_cache and self._cache_dir:
-            resource = CachedResource(
+            return CachedResource(
                 resource,
                 cache_dir=self._cache_dir,
                 ttl=self._cache_ttl,
             )
-
         return resource
 
-    def _create_http(self, url: str, **kwargs) -> HttpResource:
+    def _create_http(
+        self, url: str, parsed: Optional[SplitResult] = None, **kwargs
+    ) -> HttpResource:
         """Create HTTP resource, using CEH-specific class if appropriate."""
-        # Check if this is a CEH catalogue URL
-        if "catalogue.ceh.ac.uk" in url:
-            return self._create_ceh_resource(url, **kwargs)
+        if parsed is None:
+            parsed = _cached_urlsplit(url)
 
-        # Check if this is a CEH supporting docs URL
-        if "data-package.ceh.ac.uk/sd" in url:
-            return self._create_ceh_supporting_docs(url, **kwargs)
+        # Route CEH catalogue and supporting docs URLs by host
+        route = self._ceh_host_routes.get(parsed.netloc)
+        if route is not None:
+            path_prefix, builder = route
+            if parsed.path.startswith(path_prefix):
+                return builder(url, parsed, **kwargs)
 
         # Generic HTTP resource
         return HttpResource(
@@ -128,37 +174,21 @@ class ResourceFactory:
             **{k: v for k, v in kwargs.items() if k != "timeout"},
         )
 
-    def _create_ceh_resource(self, url: str, **kwargs) -> Resource:
+    def _create_ceh_resource(
+        self, url: str, parsed: SplitResult, **kwargs
+    ) -> Resource:
         """Create CEH catalogue resource from URL."""
-        # Extract dataset ID and format from URL
-        parsed = urlparse(url)
-
         # Try to extract dataset ID from path
-        path_parts = parsed.path.strip("/").split("/")
-        dataset_id = None
-
-        for part in path_parts:
-            # UUIDs are 36 chars with specific format
-            if len(part) >= 36 and "-" in part:
-                # Remove any extension
-                dataset_id = part.split(".")[0]
-                break
-
-        if not dataset_id:
+        match = _UUID_RE.search(parsed.path)
+        if not match:
             # Fall back to generic HTTP resource
             return HttpResource(url, **kwargs)
+        dataset_id = match.group(0)
 
         # Determine format from query string
-        format_type = "json"  # Default
-        if "format=" in url:
-            if "format=gemini" in url:
-                format_type = "gemini"
-            elif "format=schema.org" in url:
-                format_type = "schema.org"
-            elif "format=ttl" in url:
-                format_type = "ttl"
-            elif "format=json" in url:
-                format_type = "json"
+        format_type = parse_qs(parsed.query).get("format", ["json"])[0]
+        if format_type not in CEHCatalogueResource.FORMAT_HEADERS:
+            format_type = "json"
 
         return CEHCatalogueResource(
             dataset_id=dataset_id,
@@ -167,25 +197,37 @@ class ResourceFactory:
             auth=kwargs.get("auth"),
         )
 
-    def _create_ceh_supporting_docs(self, url: str, **kwargs) -> Resource:
+    def _create_ceh_supporting_docs(
+        self, url: str, parsed: SplitResult, **kwargs
+    ) -> Resource:
         """Create CEH supporting docs resource from URL."""
-        parsed = urlparse(url)
-
         # Extract dataset ID from path like /sd/{uuid}.zip
-        path_parts = parsed.path.strip("/").split("/")
-        for part in path_parts:
-            if part.endswith(".zip"):
-                dataset_id = part[:-4]  # Remove .zip
-                return CEHSupportingDocsResource(
-                    dataset_id=dataset_id,
-                    timeout=kwargs.get("timeout", 60.0),
-                    auth=kwargs.get("auth"),
-                )
+        match = _ZIP_UUID_RE.search(parsed.path)
+        if match:
+            return CEHSupportingDocsResource(
+                dataset_id=match.group(1),
+                timeout=kwargs.get("timeout", 60.0),
+                auth=kwargs.get("auth"),
+            )
 
         # Fall back to generic HTTP
         return HttpResource(url, **kwargs)
 
-    def _create_zip(self, parsed, **kwargs) -> ZipEntryResource:
+    def _create_file_url(
+        self, url: str, parsed: SplitResult, **kwargs
+    ) -> LocalFileResource:
+        """Create local file resource from a file:// URL."""
+        return LocalFileResource(parsed.path)
+
+    def _create_local(
+        self, path: str, parsed: SplitResult, **kwargs
+    ) -> LocalFileResource:
+        """Create local file resource from a scheme-less path."""
+        return LocalFileResource(path)
+
+    def _create_zip(
+        self, url: str, parsed: SplitResult, **kwargs
+    ) -> ZipEntryResource:
         """Create ZIP entry resource from parsed URL."""
         # Format: zip://path/to/archive.zip#entry_name
         zip_path = parsed.path
@@ -208,15 +250,7 @@ class ResourceFactory:
         """Create local file resource."""
         resource = LocalFileResource(path)
 
-        should_cache = kwargs.get("cache", self._enable_caching)
-        if should_cache and self._cache_dir:
-            resource = CachedResource(
-                resource,
-                cache_dir=self._cache_dir,
-                ttl=self._cache_ttl,
-            )
-
-        return resource
+        return self._maybe_cache(resource, kwargs.get("cache"))
 
     def zip_entry(
         self,
@@ -227,15 +261,7 @@ class ResourceFactory:
         """Create ZIP entry resource."""
         resource = ZipEntryResource(zip_path, entry_name)
 
-        should_cache = kwargs.get("cache", self._enable_caching)
-        if should_cache and self._cache_dir:
-            resource = CachedResource(
-                resource,
-                cache_dir=self._cache_dir,
-                ttl=self._cache_ttl,
-            )
-
-        return resource
+        return self._maybe_cache(resource, kwargs.get("cache"))
 
     def ceh_metadata(
         self,
@@ -261,15 +287,7 @@ class ResourceFactory:
             auth=kwargs.get("auth"),
         )
 
-        should_cache = kwargs.get("cache", self._enable_caching)
-        if should_cache and self._cache_dir:
-            resource = CachedResource(
-                resource,
-                cache_dir=self._cache_dir,
-                ttl=self._cache_ttl,
-            )
-
-        return resource
+        return self._maybe_cache(resource, kwargs.get("cache"))
 
     def ceh_supporting_docs(
         self,
@@ -292,27 +310,50 @@ class ResourceFactory:
             auth=kwargs.get("auth"),
         )
 
-        should_cache = kwargs.get("cache", self._enable_caching)
-        if should_cache and self._cache_dir:
-            resource = CachedResource(
-                resource,
-                cache_dir=self._cache_dir,
-                ttl=self._cache_ttl,
-            )
+        return self._maybe_cache(resource, kwargs.get("cache"))
 
-        return resource
+
+async def fetch_many(
+    resources: Iterable[Resource],
+    concurrency: int = 16,
+) -> list[FetchResult]:
+    """
+    Fetch resources concurrently, at most `concurrency` at a time.
+
+    HTTP resources share the per-loop connection pool, so round-trips
+    overlap instead of running back to back.
+
+    Args:
+        resources: Resources to fetch
+        concurrency: Maximum number of fetches in flight
+
+    Returns:
+        FetchResults in the same order as `resources`
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(resource: Resource) -> FetchResult:
+        async with semaphore:
+            return await resource.fetch()
+
+    return await asyncio.gather(*(fetch_one(r) for r in resources))
 
 
 # Default factory instance
 _default_factory: Optional[ResourceFactory] = None
+_default_factory_lock = threading.Lock()
 
 
 def get_default_factory() -> ResourceFactory:
-    """Get or create the default factory instance."""
+    """Get or create the default factory instance (thread-safe)."""
     global _default_factory
-    if _default_factory is None:
-        _default_factory = ResourceFactory()
-    return _default_factory
+    factory = _default_factory
+    if factory is None:
+        with _default_factory_lock:
+            if _default_factory is None:
+                _default_factory = ResourceFactory()
+            factory = _default_factory
+    return factory
 
 
 def configure_default_factory(
@@ -332,9 +373,11 @@ def configure_default_factory(
         Configured ResourceFactory
     """
     global _default_factory
-    _default_factory = ResourceFactory(
+    factory = ResourceFactory(
         cache_dir=cache_dir,
         cache_ttl=cache_ttl,
         enable_caching=enable_caching,
     )
-    return _default_factory
\ No newline at end of file
+    with _default_factory_lock:
+        _default_factory = factory
+    return factory
\ No newline at end of file
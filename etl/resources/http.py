@@ -5,20 +5,140 @@ Fetches content from HTTP/HTTPS URLs using aiohttp for async operations.
 Includes retry logic, timeout handling, and proper error management.
 """
 
-import asyncio
-from datetime import datetime
-from typing import Optional
-from urllib.parse import urlparse
+from __future__ import annotations
 
-import aiohttp
+import asyncio
+import base64
+import copy
+import hashlib
+import random
+import time
+from dataclasses import replace
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, AsyncIterator, Mapping, Optional
+from urllib.parse import urlsplit
 
 from .base import (
+    DEFAULT_CHUNK_SIZE,
     FetchResult,
     Resource,
     ResourceMetadata,
     ResourceType,
 )
 
+if TYPE_CHECKING:
+    import aiohttp
+else:
+    # Bound by _load_aiohttp() when the first HttpResource is created, so
+    # code that only touches local resources never pays for the import
+    aiohttp = None
+
+
+def _load_aiohttp() -> None:
+    """Import aiohttp into module scope on first use."""
+    global aiohttp
+    if aiohttp is None:
+        import aiohttp
+
+
+# One pooled session per event loop; aiohttp sessions are loop-bound, so
+# a module-wide singleton would break under repeated asyncio.run() calls.
+# A session's connector holds its loop, so entries never expire on their
+# own: every entry point must await close_http_session() before its loop
+# ends. Entries left behind by closed loops are dropped on the next lookup.
+_SESSIONS: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """
+    Return the shared ClientSession for the running loop, creating it lazily.
+
+    Creation is synchronous, so no lock is needed within a single loop.
+    Callers must not close the returned session.
+    """
+    loop = asyncio.get_running_loop()
+    session = _SESSIONS.get(loop)
+    if session is None or session.closed:
+        for stale_loop in [other for other in _SESSIONS if other.is_closed()]:
+            del _SESSIONS[stale_loop]
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+        )
+        _SESSIONS[loop] = session
+    return session
+
+
+async def close_http_session() -> None:
+    """Close the shared ClientSession for the running loop, if any."""
+    session = _SESSIONS.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+# Shared, read-only default so header-less resources allocate nothing
+_EMPTY_HEADERS: Mapping[str, str] = MappingProxyType({})
+
+
+def _with_validators(
+    headers: Mapping[str, str],
+    etag: Optional[str],
+    last_modified: Optional[datetime],
+) -> Mapping[str, str]:
+    """Add If-None-Match / If-Modified-Since to a copy of headers."""
+    if etag is None and last_modified is None:
+        return headers
+
+    headers = dict(headers)
+    if etag is not None:
+        headers["If-None-Match"] = etag
+    if last_modified is not None:
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        headers["If-Modified-Since"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+    return headers
+
+
+def _copy_metadata(metadata: ResourceMetadata) -> ResourceMetadata:
+    """Copy metadata with its own extra dict."""
+    return replace(metadata, extra=dict(metadata.extra))
+
+
+def _basic_auth(username: str, password: str) -> str:
+    """Authorization header value for HTTP Basic auth (latin-1, as aiohttp)."""
+    token = base64.b64encode(f"{username}:{password}".encode("latin1"))
+    return f"Basic {token.decode('ascii')}"
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) to seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _catalogue_url(base_url: str, dataset_id: str, format: str) -> str:
+    """CEH catalogue URL for a dataset/format, memoized for repeat IDs."""
+    if format == "gemini":
+        return f"{base_url}/id/{dataset_id}.xml?format=gemini"
+    return f"{base_url}/id/{dataset_id}?format={format}"
+
 
 class HttpResource(Resource):
     """
@@ -46,17 +166,39 @@ class HttpResource(Resource):
         data = json.loads(result.text)
     """
 
+    __slots__ = (
+        "_url",
+        "_headers",
+        "_request_headers",
+        "_timeout",
+        "_max_retries",
+        "_retry_delay",
+        "_auth",
+        "_aiohttp_timeout",
+        "_last_probe",
+    )
+
     # Transient HTTP status codes that warrant retry
     RETRY_STATUS_CODES = {408, 429, 500, 502, 503, 504}
 
+    # How long a HEAD/GET response answers exists()/get_metadata() without
+    # another round-trip
+    PROBE_TTL = 5.0
+
+    # Upper bound on any wait between attempts, so a huge Retry-After (or a
+    # far-future HTTP date) cannot stall an ETL run
+    MAX_RETRY_AFTER = 60.0
+
     def __init__(
         self,
         url: str,
-        headers: Optional[dict[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
         timeout: float = 30.0,
         max_retries: int = 3,
         retry_delay: float = 1.0,
         auth: Optional[tuple[str, str]] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[datetime] = None,
     ):
         """
         Initialize HTTP resource.
@@ -68,16 +210,33 @@ class HttpResource(Resource):
             max_retries: Number of retry attempts
             retry_delay: Base delay between retries (exponential backoff)
             auth: Optional (username, password) for basic auth
+            etag: Validator sent as If-None-Match (conditional GET)
+            last_modified: Validator sent as If-Modified-Since
         """
+        _load_aiohttp()
+
         self._url = url
-        self._headers = headers or {}
+        self._headers = headers if headers is not None else _EMPTY_HEADERS
+        if auth:
+            # Encoded once; sent as a plain header instead of auth= per call
+            self._headers = {
+                **self._headers,
+                "Authorization": _basic_auth(*auth),
+            }
+        self._request_headers = _with_validators(
+            self._headers, etag, last_modified
+        )
         self._timeout = timeout
         self._max_retries = max_retries
         self._retry_delay = retry_delay
         self._auth = auth
 
+        # Built once; aiohttp treats it as an immutable per-request option
+        self._aiohttp_timeout = aiohttp.ClientTimeout(total=timeout)
+        self._last_probe: Optional[tuple[float, ResourceMetadata]] = None
+
         # Validate URL
-        parsed = urlparse(url)
+        parsed = urlsplit(url)
         if parsed.scheme not in ("http", "https"):
             raise ValueError(f"Invalid URL scheme: {parsed.scheme}")
 
@@ -95,39 +254,74 @@ class HttpResource(Resource):
         """The URL being fetched."""
         return self._url
 
+    def with_validators(
+        self,
+        etag: Optional[str] = None,
+        last_modified: Optional[datetime] = None,
+    ) -> "HttpResource":
+        """
+        Copy of this resource that issues conditional GETs.
+
+        A 304 response yields a successful FetchResult with
+        not_modified=True and empty content. The original is untouched.
+        """
+        conditional = copy.copy(self)
+        conditional._request_headers = _with_validators(
+            self._headers, etag, last_modified
+        )
+        return conditional
+
     async def exists(self) -> bool:
         """
         Check if resource exists using HEAD request.
 
+        A response seen within PROBE_TTL (from a HEAD or a fetch) is
+        reused instead of issuing another request.
+
         Returns:
             True if resource returns 2xx status, False otherwise
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                auth = None
-                if self._auth:
-                    auth = aiohttp.BasicAuth(self._auth[0], self._auth[1])
-
-                async with session.head(
-                    self._url,
-                    headers=self._headers,
-                    timeout=aiohttp.ClientTimeout(total=self._timeout),
-                    auth=auth,
-                    allow_redirects=True,
-                ) as response:
-                    return response.status < 400
+            metadata = await self._probe()
         except Exception:
             return False
+        return metadata.extra["status_code"] < 400
+
+    async def _probe(self) -> ResourceMetadata:
+        """Metadata from a recent response, else from a fresh HEAD request."""
+        probe = self._last_probe
+        if probe is not None and time.monotonic() - probe[0] < self.PROBE_TTL:
+            return _copy_metadata(probe[1])
+
+        session = _get_session()
+        async with session.head(
+            self._url,
+            headers=self._headers,
+            timeout=self._aiohttp_timeout,
+            allow_redirects=True,
+        ) as response:
+            return self._remember_probe(self._build_metadata(response))
+
+    def _remember_probe(self, metadata: ResourceMetadata) -> ResourceMetadata:
+        """
+        Record response metadata for reuse by exists()/get_metadata().
+
+        A private copy is kept, so callers may mutate the returned object.
+        """
+        self._last_probe = (time.monotonic(), _copy_metadata(metadata))
+        return metadata
 
     async def _do_fetch(self) -> FetchResult:
         """
         Fetch content from URL with retry logic.
 
-        Implements exponential backoff for transient failures.
+        Implements exponential backoff with jitter for transient failures,
+        honouring Retry-After on 429/503 responses up to MAX_RETRY_AFTER.
         """
         last_error: Optional[str] = None
 
         for attempt in range(self._max_retries):
+            retry_after: Optional[float] = None
             try:
                 result = await self._single_fetch()
 
@@ -140,6 +334,7 @@ class HttpResource(Resource):
                     return result  # Don't retry non-transient errors
 
                 last_error = result.error
+                retry_after = result.metadata.extra.get("retry_after")
 
             except aiohttp.ClientError as e:
                 last_error = str(e)
@@ -148,10 +343,14 @@ class HttpResource(Resource):
             except Exception as e:
                 last_error = f"Unexpected error: {str(e)}"
 
-            # Exponential backoff before retry
+            # Exponential backoff before retry, unless the server said when
+            # to come back; jitter keeps concurrent clients from syncing up
             if attempt < self._max_retries - 1:
-                delay = self._retry_delay * (2 ** attempt)
-                await asyncio.sleep(delay)
+                delay = retry_after
+                if delay is None:
+                    delay = self._retry_delay * (2 ** attempt)
+                delay += random.uniform(0, delay * 0.25)
+                await asyncio.sleep(min(delay, self.MAX_RETRY_AFTER))
 
         return FetchResult.failure(
             f"Failed after {self._max_retries} attempts: {last_error}"
@@ -159,38 +358,71 @@ class HttpResource(Resource):
 
     async def _single_fetch(self) -> FetchResult:
         """Perform a single fetch attempt."""
-        async with aiohttp.ClientSession() as session:
-            auth = None
-            if self._auth:
-                auth = aiohttp.BasicAuth(self._auth[0], self._auth[1])
-
-            async with session.get(
-                self._url,
-                headers=self._headers,
-                timeout=aiohttp.ClientTimeout(total=self._timeout),
-                auth=auth,
-                allow_redirects=True,
-            ) as response:
-
-                # Build metadata from response headers
-                metadata = self._build_metadata(response)
-
-                if response.status >= 400:
-                    return FetchResult(
-                        content=b"",
-                        metadata=metadata,
-                        success=False,
-                        error=f"HTTP {response.status}: {response.reason}",
-                    )
-
-                content = await response.read()
-
+        session = _get_session()
+        async with session.get(
+            self._url,
+            headers=self._request_headers,
+            timeout=self._aiohttp_timeout,
+            allow_redirects=True,
+        ) as response:
+
+            # Build metadata from response headers
+            metadata = self._remember_probe(self._build_metadata(response))
+
+            if response.status == 304:
                 return FetchResult(
-                    content=content,
+                    content=b"",
                     metadata=metadata,
                     success=True,
+                    not_modified=True,
+                )
+
+            if response.status >= 400:
+                return FetchResult(
+                    content=b"",
+                    metadata=metadata,
+                    success=False,
+                    error=f"HTTP {response.status}: {response.reason}",
                 )
 
+            # Hash while reading so the digest costs no second pass
+            hasher = hashlib.sha256()
+            buffer = bytearray()
+            async for chunk in response.content.iter_chunked(DEFAULT_CHUNK_SIZE):
+                hasher.update(chunk)
+                buffer += chunk
+
+            return FetchResult(
+                content=bytes(buffer),
+                metadata=metadata,
+                success=True,
+                digest=hasher.hexdigest(),
+            )
+
+    async def stream(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream the response body without buffering it in memory.
+
+        Chunks are yielded as they arrive (aiohttp negotiates gzip/deflate
+        and decompresses on the fly). No retries are attempted once
+        streaming has started.
+
+        Raises:
+            aiohttp.ClientResponseError: If the server returns 4xx/5xx
+        """
+        session = _get_session()
+        async with session.get(
+            self._url,
+            headers=self._headers,
+            timeout=self._aiohttp_timeout,
+            allow_redirects=True,
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.content.iter_chunked(chunk_size):
+                yield chunk
+
     def _build_metadata(self, response: aiohttp.ClientResponse) -> ResourceMetadata:
         """Extract metadata from HTTP response."""
         # Parse content type
@@ -203,7 +435,6 @@ class HttpResource(Resource):
         last_modified = None
         if "Last-Modified" in response.headers:
             try:
-                from email.utils import parsedate_to_datetime
                 last_modified = parsedate_to_datetime(
                     response.headers["Last-Modified"]
                 )
@@ -216,40 +447,35 @@ class HttpResource(Resource):
         # Get encoding
         encoding = response.charset or "utf-8"
 
+        extra = {
+            "status_code": response.status,
+            "url": str(response.url),  # Final URL after redirects
+        }
+        if response.status in (429, 503):
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                extra["retry_after"] = retry_after
+
         return ResourceMetadata(
             content_type=content_type,
             size_bytes=size_bytes,
             last_modified=last_modified,
             etag=etag,
             encoding=encoding,
-            extra={
-                "status_code": response.status,
-                "url": str(response.url),  # Final URL after redirects
-                "headers": dict(response.headers),
-            },
+            extra=extra,
         )
 
     async def get_metadata(self) -> ResourceMetadata:
         """
         Get metadata using HEAD request (more efficient).
 
-        Falls back to GET if HEAD fails.
+        Reuses a response seen within PROBE_TTL; falls back to GET if
+        HEAD fails.
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                auth = None
-                if self._auth:
-                    auth = aiohttp.BasicAuth(self._auth[0], self._auth[1])
-
-                async with session.head(
-                    self._url,
-                    headers=self._headers,
-                    timeout=aiohttp.ClientTimeout(total=self._timeout),
-                    auth=auth,
-                    allow_redirects=True,
-                ) as response:
-                    if response.status < 400:
-                        return self._build_metadata(response)
+            metadata = await self._probe()
+            if metadata.extra["status_code"] < 400:
+                return metadata
         except Exception:
             pass
 
@@ -258,6 +484,25 @@ class HttpResource(Resource):
         return result.metadata
 
 
+# Convenience alias -> CEH catalogue format
+_FORMAT_ALIASES = {
+    "json": "json",
+    "xml": "gemini",
+    "jsonld": "schema.org",
+    "turtle": "ttl",
+}
+
+
+def _alias_constructor(alias: str, label: str) -> classmethod:
+    """Build a CEHCatalogueResource.<alias>(dataset_id) classmethod."""
+    def construct(cls, dataset_id: str, **kwargs) -> "CEHCatalogueResource":
+        return cls.for_format(dataset_id, alias, **kwargs)
+
+    construct.__name__ = alias
+    construct.__doc__ = f"Factory for {label} format."
+    return classmethod(construct)
+
+
 class CEHCatalogueResource(HttpResource):
     """
     Specialized HTTP resource for CEH Catalogue API.
@@ -272,15 +517,17 @@ class CEHCatalogueResource(HttpResource):
         result = await resource.fetch()
     """
 
+    __slots__ = ("_dataset_id", "_format")
+
     BASE_URL = "https://catalogue.ceh.ac.uk"
 
-    # Format to Accept header mapping
-    FORMAT_HEADERS = {
-        "json": {"Accept": "application/json"},
-        "gemini": {"Accept": "application/xml"},
-        "schema.org": {"Accept": "application/ld+json"},
-        "ttl": {"Accept": "text/turtle"},
-    }
+    # Format to Accept header mapping (read-only, shared by all instances)
+    FORMAT_HEADERS = MappingProxyType({
+        "json": MappingProxyType({"Accept": "application/json"}),
+        "gemini": MappingProxyType({"Accept": "application/xml"}),
+        "schema.org": MappingProxyType({"Accept": "application/ld+json"}),
+        "ttl": MappingProxyType({"Accept": "text/turtle"}),
+    })
 
     def __init__(
         self,
@@ -305,7 +552,7 @@ class CEHCatalogueResource(HttpResource):
         url = self._build_url(dataset_id, format)
 
         # Get appropriate headers
-        headers = self.FORMAT_HEADERS.get(format, {})
+        headers = self.FORMAT_HEADERS.get(format, _EMPTY_HEADERS)
 
         super().__init__(
             url=url,
@@ -317,10 +564,7 @@ class CEHCatalogueResource(HttpResource):
     @classmethod
     def _build_url(cls, dataset_id: str, format: str) -> str:
         """Build the appropriate URL for the format."""
-        if format == "gemini":
-            return f"{cls.BASE_URL}/id/{dataset_id}.xml?format=gemini"
-        else:
-            return f"{cls.BASE_URL}/id/{dataset_id}?format={format}"
+        return _catalogue_url(cls.BASE_URL, dataset_id, format)
 
     @property
     def dataset_id(self) -> str:
@@ -333,24 +577,22 @@ class CEHCatalogueResource(HttpResource):
         return self._format
 
     @classmethod
-    def json(cls, dataset_id: str, **kwargs) -> "CEHCatalogueResource":
-        """Factory for JSON format."""
-        return cls(dataset_id, format="json", **kwargs)
-
-    @classmethod
-    def xml(cls, dataset_id: str, **kwargs) -> "CEHCatalogueResource":
-        """Factory for ISO 19115 XML format."""
-        return cls(dataset_id, format="gemini", **kwargs)
+    def for_format(
+        cls, dataset_id: str, alias: str, **kwargs
+    ) -> "CEHCatalogueResource":
+        """
+        Factory keyed by format alias (json, xml, jsonld, turtle).
 
-    @classmethod
-    def jsonld(cls, dataset_id: str, **kwargs) -> "CEHCatalogueResource":
-        """Factory for JSON-LD format."""
-        return cls(dataset_id, format="schema.org", **kwargs)
+        Raises:
+            KeyError: If alias is unknown
+        """
+        return cls(dataset_id, format=_FORMAT_ALIASES[alias], **kwargs)
 
-    @classmethod
-    def turtle(cls, dataset_id: str, **kwargs) -> "CEHCatalogueResource":
-        """Factory for RDF Turtle format."""
-        return cls(dataset_id, format="ttl", **kwargs)
+    # Convenience constructors, e.g. CEHCatalogueResource.xml(dataset_id)
+    json = _alias_constructor("json", "JSON")
+    xml = _alias_constructor("xml", "ISO 19115 XML")
+    jsonld = _alias_constructor("jsonld", "JSON-LD")
+    turtle = _alias_constructor("turtle", "RDF Turtle")
 
 
 class CEHSupportingDocsResource(HttpResource):
@@ -363,8 +605,13 @@ class CEHSupportingDocsResource(HttpResource):
         # result.content is the ZIP file bytes
     """
 
+    __slots__ = ("_dataset_id",)
+
     BASE_URL = "https://data-package.ceh.ac.uk/sd"
 
+    # Archives can run to hundreds of MB; read them in larger slices
+    STREAM_CHUNK_SIZE = 1 << 20
+
     def __init__(
         self,
         dataset_id: str,
@@ -390,4 +637,11 @@ class CEHSupportingDocsResource(HttpResource):
 
     @property
     def dataset_id(self) -> str:
-        return self._dataset_id
\ No newline at end of file
+        return self._dataset_id
+
+    async def stream(
+        self, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Stream the ZIP archive in 1 MiB chunks by default."""
+        async for chunk in super().stream(chunk_size):
+            yield chunk
@@ -4,15 +4,27 @@ Local filesystem resource implementations.
 Provides resources for reading from local files and ZIP archives.
 """
 
+import asyncio
 import mimetypes
+import mmap
 import os
+import shutil
+import struct
+import threading
+import weakref
 import zipfile
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
+from functools import lru_cache
+from pathlib import Path, PurePath
 from typing import Optional
 
-import aiofiles
-import aiofiles.os
+try:
+    import deflate
+except ImportError:  # Optional: ZIP entries then inflate via stdlib zlib only
+    deflate = None
 
 from .base import (
     FetchResult,
@@ -22,6 +34,156 @@ from .base import (
 )
 
 
+# libdeflate inflates whole buffers only; above this size stream via zipfile
+_LIBDEFLATE_MAX_SIZE = 2 * 1024 * 1024
+
+
+@lru_cache(maxsize=256)
+def _guess_suffix_type(suffixes: str) -> tuple[Optional[str], Optional[str]]:
+    return mimetypes.guess_type("x" + suffixes)
+
+
+def _guess_type(name: str | PurePath) -> tuple[Optional[str], Optional[str]]:
+    """mimetypes.guess_type keyed on the file's extensions, cached."""
+    # guess_type only looks at trailing extensions (e.g. ".tar.gz"), so the
+    # joined suffixes give the same answer for a bounded set of cache keys
+    return _guess_suffix_type("".join(PurePath(name).suffixes))
+
+
+# ZIP local file header: 30 bytes, name/extra lengths at offset 26
+_LOCAL_HEADER_SIZE = 30
+_LOCAL_HEADER_SIG = b"PK\x03\x04"
+
+
+# Open ZipFile handles keyed by (path, mtime_ns, size): the central
+# directory is parsed once per archive version and shared by every
+# ZipEntryResource reading from it. Least recently used handles are closed.
+_ZIP_HANDLES: "OrderedDict[tuple[Path, int, int], zipfile.ZipFile]" = OrderedDict()
+_ZIP_HANDLES_MAX = 32
+_zip_handles_lock = threading.Lock()
+
+# Read-only mmap of each cached archive, created on first libdeflate read;
+# compressed bytes are inflated straight out of the page cache
+_ZIP_MAPS: "weakref.WeakKeyDictionary[zipfile.ZipFile, mmap.mmap]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _open_zip(path: Path) -> zipfile.ZipFile:
+    """Return a shared ZipFile for path, reopening if the file changed."""
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+
+    with _zip_handles_lock:
+        zf = _ZIP_HANDLES.get(key)
+        if zf is not None:
+            _ZIP_HANDLES.move_to_end(key)
+            return zf
+
+        zf = zipfile.ZipFile(path, "r")
+        _ZIP_HANDLES[key] = zf
+        if len(_ZIP_HANDLES) > _ZIP_HANDLES_MAX:
+            _, evicted = _ZIP_HANDLES.popitem(last=False)
+            _close_handle(evicted)
+        return zf
+
+
+def _zip_map(zf: zipfile.ZipFile) -> mmap.mmap:
+    """Return the shared read-only mmap of a cached archive."""
+    with _zip_handles_lock:
+        mm = _ZIP_MAPS.get(zf)
+        if mm is None:
+            mm = _ZIP_MAPS[zf] = mmap.mmap(
+                zf.fp.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        return mm
+
+
+def _close_handle(zf: zipfile.ZipFile) -> None:
+    mm = _ZIP_MAPS.pop(zf, None)
+    if mm is not None:
+        try:
+            mm.close()
+        except BufferError:
+            # A reader still holds a view; the map is freed when it's done
+            pass
+    zf.close()
+
+
+def close_zip_handles() -> None:
+    """Close all cached ZipFile handles (e.g. at shutdown or in tests)."""
+    with _zip_handles_lock:
+        for zf in _ZIP_HANDLES.values():
+            _close_handle(zf)
+        _ZIP_HANDLES.clear()
+
+
+def _inflate_small_entry(
+    zf: zipfile.ZipFile, info: zipfile.ZipInfo
+) -> Optional[bytes]:
+    """
+    Inflate a small DEFLATE entry with libdeflate.
+
+    Returns None when the entry isn't eligible (libdeflate missing, not
+    deflated, encrypted, too large) so the caller falls back to zipfile.
+    """
+    if (
+        deflate is None
+        or info.compress_type != zipfile.ZIP_DEFLATED
+        or info.file_size >= _LIBDEFLATE_MAX_SIZE
+        or info.flag_bits & 0x1
+    ):
+        return None
+
+    # Reading through the shared mmap leaves the handle's file position
+    # alone, so this can't race zipfile's own reads on the same ZipFile
+    mm = _zip_map(zf)
+    offset = info.header_offset
+    if (
+        offset + _LOCAL_HEADER_SIZE > len(mm)
+        or mm[offset:offset + 4] != _LOCAL_HEADER_SIG
+    ):
+        raise zipfile.BadZipFile(f"Bad local header for {info.filename}")
+    name_len, extra_len = struct.unpack_from("<HH", mm, offset + 26)
+    data_offset = offset + _LOCAL_HEADER_SIZE + name_len + extra_len
+
+    try:
+        with memoryview(mm) as view:
+            raw = view[data_offset:data_offset + info.compress_size]
+            try:
+                content = bytes(
+                    deflate.deflate_decompress(raw, info.file_size)
+                )
+            finally:
+                raw.release()
+    except deflate.DeflateError:
+        return None
+
+    if zlib.crc32(content) != info.CRC:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+    return content
+
+
+# Page-cache hints (Linux/BSD only). Files at least this large are read
+# once by the ETL, so their pages are dropped afterwards instead of
+# evicting the small cache files that do get reread
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+_DONTNEED_MIN_SIZE = 64 * 1024 * 1024
+
+
+def _read_file(path: Path) -> tuple[bytes, os.stat_result]:
+    """Open, read and fstat a file in one worker-thread hop."""
+    with open(path, "rb", buffering=0) as f:
+        fd = f.fileno()
+        stat = os.fstat(fd)
+        if _HAS_FADVISE:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        data = f.read()
+        if _HAS_FADVISE and stat.st_size >= _DONTNEED_MIN_SIZE:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        return data, stat
+
+
 class LocalFileResource(Resource):
     """
     Resource that reads from local filesystem.
@@ -64,17 +226,15 @@ class LocalFileResource(Resource):
     async def exists(self) -> bool:
         """Check if file exists and is readable."""
         try:
-            return await aiofiles.os.path.isfile(self._path)
+            return os.path.isfile(self._path)
         except Exception:
             return False
 
     async def _do_fetch(self) -> FetchResult:
         """Read file contents."""
         try:
-            async with aiofiles.open(self._path, "rb") as f:
-                content = await f.read()
-
-            metadata = await self._get_file_metadata()
+            content, stat = await asyncio.to_thread(_read_file, self._path)
+            metadata = self._metadata_from_stat(stat)
 
             return FetchResult(
                 content=content,
@@ -92,24 +252,27 @@ class LocalFileResource(Resource):
     async def _get_file_metadata(self) -> ResourceMetadata:
         """Extract metadata from file."""
         try:
-            stat = await aiofiles.os.stat(self._path)
-
-            # Guess content type from extension
-            content_type, encoding = mimetypes.guess_type(str(self._path))
-
-            return ResourceMetadata(
-                content_type=content_type,
-                size_bytes=stat.st_size,
-                last_modified=datetime.fromtimestamp(stat.st_mtime),
-                encoding=encoding,
-                extra={
-                    "path": str(self._path),
-                    "filename": self._path.name,
-                },
-            )
+            stat = await asyncio.to_thread(os.stat, self._path)
+            return self._metadata_from_stat(stat)
         except Exception:
             return ResourceMetadata()
 
+    def _metadata_from_stat(self, stat: os.stat_result) -> ResourceMetadata:
+        """Build metadata from a stat result and the file extension."""
+        # Guess content type from extension
+        content_type, encoding = _guess_type(self._path)
+
+        return ResourceMetadata(
+            content_type=content_type,
+            size_bytes=stat.st_size,
+            last_modified=datetime.fromtimestamp(stat.st_mtime),
+            encoding=encoding,
+            extra={
+                "path": str(self._path),
+                "filename": self._path.name,
+            },
+        )
+
     async def get_metadata(self) -> ResourceMetadata:
         """Get metadata without reading full content."""
         return await self._get_file_metadata()
@@ -168,14 +331,12 @@ class ZipEntryResource(Resource):
     async def exists(self) -> bool:
         """Check if ZIP exists and contains the entry."""
         try:
-            if not await aiofiles.os.path.isfile(self._zip_path):
+            if not os.path.isfile(self._zip_path):
                 return False
 
-            # Check if entry exists in ZIP
-            # Note: zipfile doesn't have async support, but reading
-            # the central directory is fast
-            with zipfile.ZipFile(self._zip_path, "r") as zf:
-                return self._entry_name in zf.namelist()
+            # Check if entry exists in ZIP (dict lookup on the shared
+            # handle's central directory)
+            return self._entry_name in _open_zip(self._zip_path).NameToInfo
         except Exception:
             return False
 
@@ -183,28 +344,29 @@ class ZipEntryResource(Resource):
         """Read entry from ZIP archive."""
         try:
             # zipfile doesn't support async, but extraction is typically fast
-            with zipfile.ZipFile(self._zip_path, "r") as zf:
-                # Check if entry exists
-                if self._entry_name not in zf.namelist():
-                    return FetchResult.failure(
-                        f"Entry not found in ZIP: {self._entry_name}"
-                    )
-
-                # Get entry info for metadata
-                info = zf.getinfo(self._entry_name)
-
-                # Read content
-                content = zf.read(self._entry_name)
-
-                # Build metadata
-                metadata = self._build_metadata(info)
-
-                return FetchResult(
-                    content=content,
-                    metadata=metadata,
-                    success=True,
+            zf = _open_zip(self._zip_path)
+
+            # Check if entry exists and get its info for metadata
+            info = zf.NameToInfo.get(self._entry_name)
+            if info is None:
+                return FetchResult.failure(
+                    f"Entry not found in ZIP: {self._entry_name}"
                 )
 
+            # Read content - small deflated entries via libdeflate
+            content = _inflate_small_entry(zf, info)
+            if content is None:
+                content = zf.read(info)
+
+            # Build metadata
+            metadata = self._build_metadata(info)
+
+            return FetchResult(
+                content=content,
+                metadata=metadata,
+                success=True,
+            )
+
         except zipfile.BadZipFile:
             return FetchResult.failure(f"Invalid ZIP file: {self._zip_path}")
         except Exception as e:
@@ -213,7 +375,7 @@ class ZipEntryResource(Resource):
     def _build_metadata(self, info: zipfile.ZipInfo) -> ResourceMetadata:
         """Build metadata from ZIP entry info."""
         # Guess content type from filename
-        content_type, encoding = mimetypes.guess_type(self._entry_name)
+        content_type, encoding = _guess_type(self._entry_name)
 
         # Parse modification time
         try:
@@ -245,8 +407,7 @@ class ZipEntryResource(Resource):
         Returns:
             List of entry names
         """
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            return zf.namelist()
+        return _open_zip(Path(zip_path).resolve()).namelist()
 
     @classmethod
     def from_zip(
@@ -289,30 +450,49 @@ async def extract_zip_to_directory(
     Returns:
         List of extracted file paths
     """
-    zip_path = Path(zip_path)
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # Archive open, directory listing and every write happen off the
+    # event loop in a single thread hop
+    return await asyncio.to_thread(
+        _extract_all, Path(zip_path), Path(output_dir), filter_func
+    )
 
-    extracted = []
+
+def _extract_all(
+    zip_path: Path,
+    output_dir: Path,
+    filter_func: Optional[callable],
+) -> list[Path]:
+    """Synchronous body of extract_zip_to_directory."""
+    output_dir.mkdir(parents=True, exist_ok=True)
 
     with zipfile.ZipFile(zip_path, "r") as zf:
-        for entry in zf.namelist():
-            # Skip directories
-            if entry.endswith("/"):
-                continue
+        entries = [
+            entry for entry in zf.namelist()
+            # Skip directories, apply filter
+            if not entry.endswith("/") and (not filter_func or filter_func(entry))
+        ]
+        if not entries:
+            return []
+
+        # Entries inflate independently, so decompression and writes of
+        # different entries overlap across worker threads
+        workers = min(len(entries), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(
+                lambda entry: _extract_entry(zf, entry, output_dir), entries
+            ))
+
 
-            # Apply filter
-            if filter_func and not filter_func(entry):
-                continue
+# Copy buffer for streaming entries to disk
+_EXTRACT_BUFFER_SIZE = 256 * 1024
 
-            # Extract
-            target_path = output_dir / entry
-            target_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with zf.open(entry) as src:
-                async with aiofiles.open(target_path, "wb") as dst:
-                    await dst.write(src.read())
+def _extract_entry(zf: zipfile.ZipFile, entry: str, output_dir: Path) -> Path:
+    """Inflate one ZIP entry to output_dir (runs in a worker thread)."""
+    target_path = output_dir / entry
+    target_path.parent.mkdir(parents=True, exist_ok=True)
 
-            extracted.append(target_path)
+    with zf.open(entry) as src, open(target_path, "wb") as dst:
+        shutil.copyfileobj(src, dst, _EXTRACT_BUFFER_SIZE)
 
-    return extracted
\ No newline at end of file
+    return target_path
\ No newline at end of file
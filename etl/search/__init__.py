@@ -11,6 +11,7 @@ from .hybrid import (
     QueryType,
     hybrid_search,
 )
+from .cache import SemanticQueryCache
 
 __all__ = [
     "HybridSearchService",
@@ -18,4 +19,5 @@ __all__ = [
     "HybridSearchResponse",
     "QueryType",
     "hybrid_search",
+    "SemanticQueryCache",
 ]
\ No newline at end of file
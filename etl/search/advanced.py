@@ -13,8 +13,11 @@ No new pip dependencies — CrossEncoder is part of sentence-transformers.
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass, field
-from typing import Optional
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Optional
 
 from etl.search.hybrid import HybridSearchResult
 
@@ -37,21 +40,49 @@ _SYNONYMS: dict[str, list[str]] = {
     "temperature": ["thermal", "heat", "warming"],
     "nitrogen": ["nitrate", "nitrite", "nutrient"],
     "phosphorus": ["phosphate", "nutrient"],
-    "woodland": ["forest", "tree", "canopy", "woodland"],
+    "woodland": ["forest", "tree", "canopy"],
     "peat": ["peatland", "bog", "mire", "fen"],
 }
 
+# One alternation over every synonym key: a single regex scan finds all
+# expandable words instead of a per-word dict probe in Python
+_SYNONYM_KEYS = re.compile(
+    r"\b(" + "|".join(
+        map(re.escape, sorted(_SYNONYMS, key=len, reverse=True))
+    ) + r")\b"
+)
+
+# Every synonym key and value gets one bit; _expand_query dedups with an
+# int mask instead of building a per-query set
+_SYNONYM_VOCAB: dict[str, int] = {
+    token: 1 << i
+    for i, token in enumerate(
+        sorted({*_SYNONYMS, *(s for syns in _SYNONYMS.values() for s in syns)})
+    )
+}
+_SYNONYM_BITS: dict[str, tuple[tuple[int, str], ...]] = {
+    key: tuple((_SYNONYM_VOCAB[syn], syn) for syn in syns)
+    for key, syns in _SYNONYMS.items()
+}
+_SYNONYM_MASKS: dict[str, int] = {
+    key: sum(bit for bit, _ in bits) for key, bits in _SYNONYM_BITS.items()
+}
+_SYNONYM_TOKENS: dict[str, tuple[str, ...]] = {
+    key: tuple(syns) for key, syns in _SYNONYMS.items()
+}
+
+# Intent patterns are matched against the lowercased query, so they are
+# compiled case-sensitive (no per-character case folding in the engine)
+
 # Temporal intent patterns
 _TEMPORAL_PATTERNS = re.compile(
     r"\b(\d{4}|\d{4}s|recent|historic|long.term|decad|annual|monthly|seasonal)\b",
-    re.IGNORECASE,
 )
 
 # Spatial intent patterns
 _SPATIAL_PATTERNS = re.compile(
     r"\b(uk|england|scotland|wales|ireland|north|south|east|west|coastal|"
     r"upland|lowland|catchment|watershed|national park)\b",
-    re.IGNORECASE,
 )
 
 
@@ -59,15 +90,83 @@ _SPATIAL_PATTERNS = re.compile(
 # Query Understanding
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class QueryAnalysis:
-    """Results of query intent analysis."""
+    """
+    Results of query intent analysis.
+
+    Frozen (tuple fields) because analyses are memoized and shared
+    between callers.
+    """
     original: str
     expanded: str
     has_temporal_intent: bool = False
     has_spatial_intent: bool = False
-    intents: list[str] = field(default_factory=list)
-    synonyms_added: list[str] = field(default_factory=list)
+    intents: tuple[str, ...] = ()
+    synonyms_added: tuple[str, ...] = ()
+
+
+@lru_cache(maxsize=1024)
+def _analyze_cached(query: str) -> QueryAnalysis:
+    """
+    Analyse and expand a query; memoized since analysis depends only on
+    the query string and UIs replay queries across paging/filter changes.
+    """
+    intents: list[str] = []
+    lowered = query.lower()
+
+    has_temporal = bool(_TEMPORAL_PATTERNS.search(lowered))
+    has_spatial = bool(_SPATIAL_PATTERNS.search(lowered))
+
+    if has_temporal:
+        intents.append("temporal")
+    if has_spatial:
+        intents.append("spatial")
+
+    expanded, synonyms_added = _expand_query(query, lowered)
+
+    return QueryAnalysis(
+        original=query,
+        expanded=expanded,
+        has_temporal_intent=has_temporal,
+        has_spatial_intent=has_spatial,
+        intents=tuple(intents),
+        synonyms_added=tuple(synonyms_added),
+    )
+
+
+def _expand_query(query: str, lowered: str) -> tuple[str, list[str]]:
+    """Return expanded query and list of added synonym tokens."""
+    matched = _SYNONYM_KEYS.findall(lowered)
+    if not matched:
+        return query, []
+
+    # Synonyms in query order, first occurrence wins, minus query words
+    seen = 0
+    vocab = _SYNONYM_VOCAB
+    for word in lowered.split():
+        seen |= vocab.get(word, 0)
+
+    extra_tokens: list[str] = []
+    for key in matched:
+        key_mask = _SYNONYM_MASKS[key]
+        missing = key_mask & ~seen
+        if not missing:
+            continue  # every synonym already present (or key repeated)
+        if missing == key_mask:
+            extra_tokens.extend(_SYNONYM_TOKENS[key])
+        else:
+            for bit, syn in _SYNONYM_BITS[key]:
+                if missing & bit:
+                    extra_tokens.append(syn)
+        seen |= key_mask
+
+    if extra_tokens:
+        expanded = query + " " + " ".join(extra_tokens)
+    else:
+        expanded = query
+
+    return expanded, extra_tokens
 
 
 class QueryUnderstanding:
@@ -84,52 +183,20 @@ class QueryUnderstanding:
 
     def analyze(self, query: str) -> QueryAnalysis:
         """Analyse and expand a query."""
-        intents: list[str] = []
-
-        has_temporal = bool(_TEMPORAL_PATTERNS.search(query))
-        has_spatial = bool(_SPATIAL_PATTERNS.search(query))
-
-        if has_temporal:
-            intents.append("temporal")
-        if has_spatial:
-            intents.append("spatial")
-
-        expanded, synonyms_added = self._expand(query)
-
-        return QueryAnalysis(
-            original=query,
-            expanded=expanded,
-            has_temporal_intent=has_temporal,
-            has_spatial_intent=has_spatial,
-            intents=intents,
-            synonyms_added=synonyms_added,
-        )
+        return _analyze_cached(query)
 
     def _expand(self, query: str) -> tuple[str, list[str]]:
         """Return expanded query and list of added synonym tokens."""
-        words = query.lower().split()
-        extra_tokens: list[str] = []
-        already_in_query = set(words)
-
-        for word in words:
-            syns = _SYNONYMS.get(word, [])
-            for syn in syns:
-                if syn not in already_in_query:
-                    extra_tokens.append(syn)
-                    already_in_query.add(syn)
-
-        if extra_tokens:
-            expanded = query + " " + " ".join(extra_tokens)
-        else:
-            expanded = query
-
-        return expanded, extra_tokens
+        return _expand_query(query, query.lower())
 
 
 # =============================================================================
 # Field-Weighted Scoring
 # =============================================================================
 
+_hybrid_score = attrgetter("hybrid_score")
+
+
 class FieldWeightedScoring:
     """
     Boost hybrid search results by field-level match quality.
@@ -155,19 +222,23 @@ class FieldWeightedScoring:
     ) -> list[HybridSearchResult]:
         """Apply field-weighted boost and re-sort in-place."""
         q = query.lower()
+        title_weight = self.title_weight
+        partial_weight = title_weight * 0.5
+        keyword_weight = self.keyword_weight
 
         for r in results:
-            title = (r.title or "").lower()
+            # Lowercased fields are cached on the result across stages
+            title = r.title_lower
 
             if q == title:
-                r.hybrid_score += self.title_weight
+                r.hybrid_score += title_weight
             elif q in title:
-                r.hybrid_score += self.title_weight * 0.5
+                r.hybrid_score += partial_weight
 
-            if any(q == kw.lower() for kw in r.keywords):
-                r.hybrid_score += self.keyword_weight
+            if q in r.keywords_lower:
+                r.hybrid_score += keyword_weight
 
-        results.sort(key=lambda x: x.hybrid_score, reverse=True)
+        results.sort(key=_hybrid_score, reverse=True)
         return results
 
 
@@ -175,31 +246,87 @@ class FieldWeightedScoring:
 # Cross-Encoder Reranker (lazy-loaded)
 # =============================================================================
 
+# Loaded models shared by every reranker in the process, keyed by
+# (model_name, use_onnx); the lock stops concurrent first calls loading twice
+_MODEL_CACHE: dict[tuple[str, bool], Any] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
 class CrossEncoderReranker:
     """
     Neural cross-encoder reranker using sentence-transformers.
 
-    The model is lazy-loaded on first call to avoid startup overhead (~80 MB).
+    The model is lazy-loaded on first call to avoid startup overhead (~80 MB)
+    and shared process-wide, so every pipeline reuses one loaded copy; call
+    ``warmup()`` at startup to pay the load and first inference up front.
     Adds ~100-500 ms latency when reranking top-N results.
 
     Default model: cross-encoder/ms-marco-MiniLM-L-6-v2
+
+    When the ONNX backend is installed (``optimum[onnxruntime]``) the
+    model's dynamic-int8 ONNX export is used, which is several times
+    faster on CPU than FP32 PyTorch; otherwise the PyTorch model loads.
     """
 
     DEFAULT_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
 
-    def __init__(self, model_name: str = DEFAULT_MODEL):
+    # Pre-quantized (dynamic int8, VNNI) export shipped in the model repo
+    ONNX_INT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+    # Inputs are capped by characters before tokenization; the token cap
+    # keeps every pair short (attention cost grows with length squared)
+    TITLE_CHARS = 120
+    ABSTRACT_CHARS = 180
+    MAX_LENGTH = 128
+
+    def __init__(self, model_name: str = DEFAULT_MODEL, use_onnx: bool = True):
         self.model_name = model_name
+        self.use_onnx = use_onnx
         self._model = None  # Lazy-loaded
 
     def _load_model(self):
         if self._model is None:
-            try:
-                from sentence_transformers import CrossEncoder
-                self._model = CrossEncoder(self.model_name)
-            except Exception as exc:
-                raise RuntimeError(
-                    f"Failed to load CrossEncoder model '{self.model_name}': {exc}"
-                ) from exc
+            key = (self.model_name, self.use_onnx)
+            model = _MODEL_CACHE.get(key)
+            if model is None:
+                with _MODEL_CACHE_LOCK:
+                    model = _MODEL_CACHE.get(key)
+                    if model is None:
+                        model = _MODEL_CACHE[key] = self._create_model()
+            self._model = model
+
+    def _create_model(self):
+        try:
+            from sentence_transformers import CrossEncoder
+            model = None
+            if self.use_onnx:
+                model = self._load_onnx(CrossEncoder)
+            if model is None:
+                model = CrossEncoder(self.model_name, max_length=self.MAX_LENGTH)
+            return model
+        except Exception as exc:
+            raise RuntimeError(
+                f"Failed to load CrossEncoder model '{self.model_name}': {exc}"
+            ) from exc
+
+    def _load_onnx(self, cross_encoder_cls):
+        """Load the int8 ONNX export, or None if the backend/file is unavailable."""
+        try:
+            return cross_encoder_cls(
+                self.model_name,
+                max_length=self.MAX_LENGTH,
+                backend="onnx",
+                model_kwargs={"file_name": self.ONNX_INT8_FILE},
+            )
+        except Exception:
+            return None
+
+    def warmup(self) -> None:
+        """Load the shared model and run one inference so the first query is fast."""
+        self._load_model()
+        self._model.predict(  # type: ignore[union-attr]
+            [("warm", "up")], show_progress_bar=False
+        )
 
     def rerank(
         self,
@@ -208,34 +335,45 @@ class CrossEncoderReranker:
         top_n: int = 10,
     ) -> list[HybridSearchResult]:
         """
-        Rerank the top-N results using the cross-encoder.
+        Rerank the top-N results using the cross-encoder, in place.
 
-        Results beyond top_n are appended unchanged after the reranked set.
+        Results beyond top_n are left unchanged after the reranked set.
 
         Args:
             query: The search query.
-            results: Current ranked results (from hybrid/RRF).
+            results: Current ranked results (from hybrid/RRF); reordered
+                in place.
             top_n: How many top results to rerank.
 
         Returns:
-            Reranked + remaining results.
+            The same list, reranked.
         """
         self._load_model()
 
         to_rerank = results[:top_n]
-        remainder = results[top_n:]
 
         if not to_rerank:
             return results
 
-        pairs = [(query, f"{r.title}. {(r.abstract or '')[:200]}") for r in to_rerank]
-        scores = self._model.predict(pairs)  # type: ignore[union-attr]
+        title_chars = self.TITLE_CHARS
+        abstract_chars = self.ABSTRACT_CHARS
+        pairs = [
+            (
+                query,
+                (r.title or "")[:title_chars] + ". " + (r.abstract or "")[:abstract_chars],
+            )
+            for r in to_rerank
+        ]
+        scores = self._model.predict(  # type: ignore[union-attr]
+            pairs, batch_size=32, show_progress_bar=False
+        )
 
         for result, score in zip(to_rerank, scores):
             result.hybrid_score = float(score)
 
-        to_rerank.sort(key=lambda x: x.hybrid_score, reverse=True)
-        return to_rerank + remainder
+        to_rerank.sort(key=_hybrid_score, reverse=True)
+        results[:top_n] = to_rerank
+        return results
 
 
 # =============================================================================
@@ -274,11 +412,19 @@ class AdvancedSearchPipeline:
         title_weight: float = 2.0,
         keyword_weight: float = 1.0,
         rerank_top_n: int = 10,
+        margin_skip_threshold: Optional[float] = None,
     ):
         self.query_understanding = QueryUnderstanding()
         self.field_scorer = FieldWeightedScoring(title_weight, keyword_weight)
         self.use_reranker = use_reranker
         self.rerank_top_n = rerank_top_n
+        # Top-1 lead over the runner-up beyond which reranking is skipped;
+        # the default lets an exact title match through without the model
+        self.margin_skip_threshold = (
+            title_weight * 0.9
+            if margin_skip_threshold is None
+            else margin_skip_threshold
+        )
         self._reranker: Optional[CrossEncoderReranker] = None
 
         if use_reranker:
@@ -302,14 +448,20 @@ class AdvancedSearchPipeline:
         # 1. Understand the query
         analysis = self.query_understanding.analyze(query)
 
-        # 2. Field-weighted boost
+        # 2. Field-weighted boost - the one copy of the caller's list;
+        #    rescoring and reranking then reorder it in place
         results = self.field_scorer.rescore(list(hybrid_results), analysis.expanded)
 
-        # 3. Optional cross-encoder reranking
+        # 3. Optional cross-encoder reranking, skipped when the field-weighted
+        #    leader is already unambiguous
         reranked = False
-        if self.use_reranker and self._reranker is not None:
+        if (
+            self.use_reranker
+            and self._reranker is not None
+            and not self._is_unambiguous(results)
+        ):
             try:
-                results = self._reranker.rerank(query, results, top_n=self.rerank_top_n)
+                self._reranker.rerank(query, results, top_n=self.rerank_top_n)
                 reranked = True
             except RuntimeError:
                 # Model unavailable — skip reranking silently
@@ -320,3 +472,11 @@ class AdvancedSearchPipeline:
             query_analysis=analysis,
             reranked=reranked,
         )
+
+    def _is_unambiguous(self, results: list[HybridSearchResult]) -> bool:
+        """True if the top result leads the runner-up by more than the margin."""
+        return (
+            len(results) >= 2
+            and results[0].hybrid_score - results[1].hybrid_score
+            > self.margin_skip_threshold
+        )
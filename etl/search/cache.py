@@ -0,0 +1,206 @@
+"""
+Semantic Query Cache.
+
+Caches hybrid search responses so repeated or near-duplicate queries
+skip the vector search and the MongoDB keyword search.
+
+Two layers share one bounded store:
+- Exact: normalised query text -> response (dict lookup)
+- Semantic: cosine similarity of the query embedding against every cached
+  embedding in one matrix-vector product; the best match above the
+  threshold is a hit
+
+Entries expire after a TTL and the least recently used entry is evicted
+when the cache is full. Responses are copied on the way in and out, since
+downstream stages rescore results in place.
+
+Usage:
+    cache = SemanticQueryCache(max_size=1024, ttl_seconds=300)
+    service = HybridSearchService(vector_store, repository, cache=cache)
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import TYPE_CHECKING, Hashable, Optional, Sequence
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .hybrid import HybridSearchResponse
+
+
+class SemanticQueryCache:
+    """
+    Bounded TTL + LRU cache of hybrid search responses.
+
+    Entries are keyed by (normalised query, params), where params is any
+    hashable describing the search settings (e.g. result limits); a
+    response is only ever served for the same params.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_seconds: float = 300.0,
+        similarity_threshold: float = 0.92,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+
+        self._lock = threading.Lock()
+        # key -> slot, in LRU order (oldest first)
+        self._slots: "OrderedDict[tuple[str, Hashable], int]" = OrderedDict()
+        self._free: list[int] = list(range(max_size - 1, -1, -1))
+
+        # Per-slot state; the embedding matrix is allocated on first insert
+        # once the dimension is known. Rows are unit-normalised, so a dot
+        # product is the cosine similarity.
+        self._keys: list[Optional[tuple[str, Hashable]]] = [None] * max_size
+        self._responses: list[Optional["HybridSearchResponse"]] = [None] * max_size
+        self._expires = np.zeros(max_size)
+        self._vectors: Optional[np.ndarray] = None
+        # Small int id per distinct params, so the semantic layer can mask
+        # candidates with one vectorised comparison (-1 = no embedding)
+        self._param_ids: dict[Hashable, int] = {}
+        self._params = np.full(max_size, -1, dtype=np.int64)
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Normalise query text for the exact-match layer."""
+        return " ".join(query.lower().split())
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def get_exact(
+        self, query: str, params: Hashable
+    ) -> Optional["HybridSearchResponse"]:
+        """Return a copy of the cached response for this exact query, if fresh."""
+        key = (self.normalize(query), params)
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                return None
+            if self._expires[slot] < time.monotonic():
+                self._evict(slot)
+                return None
+            self._slots.move_to_end(key)
+            response = self._responses[slot]
+        return _copy_response(response, query)
+
+    def get_similar(
+        self, query: str, embedding: Sequence[float], params: Hashable
+    ) -> Optional["HybridSearchResponse"]:
+        """
+        Return a copy of the most similar fresh cached response, if any.
+
+        The copy keeps the matched entry's query text, since its ranking
+        was computed for that query; the caller re-targets it at query.
+        """
+        with self._lock:
+            param_id = self._param_ids.get(params)
+            if self._vectors is None or param_id is None:
+                return None
+
+            q = _unit(embedding)
+            if q is None or q.shape[0] != self._vectors.shape[1]:
+                return None
+
+            sims = self._vectors @ q
+            # Only live, fresh slots for the same params are candidates
+            sims[
+                (self._params != param_id) | (self._expires < time.monotonic())
+            ] = -np.inf
+            slot = int(np.argmax(sims))
+            if sims[slot] < self.similarity_threshold:
+                return None
+
+            self._slots.move_to_end(self._keys[slot])
+            response = self._responses[slot]
+        return _copy_response(response, response.query)
+
+    def put(
+        self,
+        query: str,
+        embedding: Optional[Sequence[float]],
+        params: Hashable,
+        response: "HybridSearchResponse",
+    ) -> None:
+        """Cache a copy of response for query; evicts the LRU entry when full."""
+        if self.max_size <= 0:
+            return
+
+        key = (self.normalize(query), params)
+        q = _unit(embedding) if embedding is not None else None
+        stored = _copy_response(response, response.query)
+
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                if not self._free:
+                    _, oldest = self._slots.popitem(last=False)
+                    self._clear_slot(oldest)
+                slot = self._free.pop()
+                self._slots[key] = slot
+            else:
+                self._slots.move_to_end(key)
+
+            self._keys[slot] = key
+            self._responses[slot] = stored
+            self._expires[slot] = time.monotonic() + self.ttl_seconds
+            self._params[slot] = -1
+
+            if q is not None:
+                if self._vectors is None:
+                    self._vectors = np.zeros(
+                        (self.max_size, q.shape[0]), dtype=np.float32
+                    )
+                if q.shape[0] == self._vectors.shape[1]:
+                    self._vectors[slot] = q
+                    self._params[slot] = self._param_ids.setdefault(
+                        params, len(self._param_ids)
+                    )
+
+    def clear(self) -> None:
+        """Drop every entry (e.g. after the catalogue changes)."""
+        with self._lock:
+            for slot in list(self._slots.values()):
+                self._clear_slot(slot)
+            self._slots.clear()
+
+    def _evict(self, slot: int) -> None:
+        key = self._keys[slot]
+        if key is not None:
+            self._slots.pop(key, None)
+        self._clear_slot(slot)
+
+    def _clear_slot(self, slot: int) -> None:
+        self._keys[slot] = None
+        self._responses[slot] = None
+        self._params[slot] = -1
+        self._expires[slot] = 0.0
+        self._free.append(slot)
+
+
+def _unit(embedding: Sequence[float]) -> Optional[np.ndarray]:
+    """Return embedding as a unit-length float32 vector (None if zero)."""
+    vec = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    if norm == 0.0:
+        return None
+    return vec / norm
+
+
+def _copy_response(
+    response: "HybridSearchResponse", query: str
+) -> "HybridSearchResponse":
+    """Copy a response and its results so callers can mutate them freely."""
+    return replace(
+        response,
+        results=[copy.copy(r) for r in response.results],
+        query=query,
+    )
@@ -17,13 +17,79 @@ Design:
 
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 from typing import Optional
-import re
+import asyncio
+import heapq
+import uuid
 
 from etl.embeddings import VectorStore, SearchResult as SemanticResult
 from etl.repository import DatasetRepository
 from etl.models.dataset import DatasetMetadata
 
+from .cache import SemanticQueryCache
+
+
+def _is_uuid(query: str) -> bool:
+    """True for a canonical hyphenated UUID (8-4-4-4-12 hex digits)."""
+    # Cheap shape check first: uuid.UUID ignores hyphen positions, and the
+    # int() parse behind it accepts "+", "_" and non-ASCII digits
+    if (
+        len(query) != 36
+        or query[8] != "-" or query[13] != "-"
+        or query[18] != "-" or query[23] != "-"
+        or not query.isascii()
+        or not query.replace("-", "").isalnum()
+    ):
+        return False
+    try:
+        uuid.UUID(query)
+    except ValueError:
+        return False
+    return True
+
+
+def _apply_exact_boost(
+    result: "HybridSearchResult",
+    query_lower: str,
+    title_boost: float,
+    partial_boost: float,
+    keyword_boost: float,
+) -> None:
+    """Add exact/partial title and keyword match boosts to one result."""
+    # Lowercased fields are cached on the result and reused by the
+    # advanced pipeline's rescoring
+    title = result.title_lower
+    if title:
+        if query_lower == title:
+            result.hybrid_score += title_boost
+            result.is_exact_match = True
+        elif query_lower in title:
+            result.hybrid_score += partial_boost
+
+    if query_lower in result.keywords_lower:
+        result.hybrid_score += keyword_boost
+
+
+def _exact_boost_amount(
+    result: "HybridSearchResult",
+    query_lower: str,
+    title_boost: float,
+    partial_boost: float,
+    keyword_boost: float,
+) -> float:
+    """Total boost _apply_exact_boost adds to result for query_lower."""
+    amount = 0.0
+    title = result.title_lower
+    if title:
+        if query_lower == title:
+            amount += title_boost
+        elif query_lower in title:
+            amount += partial_boost
+    if query_lower in result.keywords_lower:
+        amount += keyword_boost
+    return amount
+
 
 class QueryType(str, Enum):
     """Detected query type."""
@@ -33,7 +99,7 @@ class QueryType(str, Enum):
     NORMAL = "normal"               # Regular query
 
 
-@dataclass
+@dataclass(slots=True)
 class HybridSearchResult:
     """A single search result with hybrid scoring."""
     dataset_id: str
@@ -55,8 +121,76 @@ class HybridSearchResult:
     organisation: Optional[str] = None
     access_level: str = "public"
 
+    # Lowercased title/keywords, computed on first use by rescoring stages
+    _title_lc: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _keywords_lc: Optional[frozenset[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-@dataclass
+    # Fast constructors for the RRF merge: __new__ plus direct slot stores,
+    # skipping the generated __init__. Every field must be set here; the
+    # tests compare these against the regular constructor.
+
+    @classmethod
+    def _from_semantic(
+        cls, result: SemanticResult, score: float, rank: int
+    ) -> "HybridSearchResult":
+        obj = cls.__new__(cls)
+        obj.dataset_id = result.dataset_id
+        obj.title = result.title
+        obj.abstract = result.abstract
+        obj.hybrid_score = score
+        obj.semantic_rank = rank
+        obj.keyword_rank = None
+        obj.from_semantic = True
+        obj.from_keyword = False
+        obj.is_exact_match = False
+        obj.keywords = result.keywords
+        obj.organisation = None
+        obj.access_level = result.access_level
+        obj._title_lc = None
+        obj._keywords_lc = None
+        return obj
+
+    @classmethod
+    def _from_keyword(
+        cls, dataset: DatasetMetadata, score: float, rank: int
+    ) -> "HybridSearchResult":
+        obj = cls.__new__(cls)
+        obj.dataset_id = dataset.identifier
+        obj.title = dataset.title or ""
+        obj.abstract = dataset.abstract or ""
+        obj.hybrid_score = score
+        obj.semantic_rank = None
+        obj.keyword_rank = rank
+        obj.from_semantic = False
+        obj.from_keyword = True
+        obj.is_exact_match = False
+        obj.keywords = dataset.keywords
+        obj.organisation = dataset.organisation
+        obj.access_level = dataset.access_level
+        obj._title_lc = None
+        obj._keywords_lc = None
+        return obj
+
+    @property
+    def title_lower(self) -> str:
+        """Lowercased title, computed once."""
+        if self._title_lc is None:
+            self._title_lc = self.title.lower() if self.title else ""
+        return self._title_lc
+
+    @property
+    def keywords_lower(self) -> frozenset[str]:
+        """Lowercased keywords as a set for O(1) membership, computed once."""
+        if self._keywords_lc is None:
+            self._keywords_lc = frozenset(kw.lower() for kw in self.keywords)
+        return self._keywords_lc
+
+
+@dataclass(slots=True)
 class HybridSearchResponse:
     """Response from hybrid search."""
     results: list[HybridSearchResult]
@@ -77,18 +211,13 @@ class HybridSearchService:
     - Auto-detects query type
     - RRF (Reciprocal Rank Fusion) for merging
     - Exact match boosting
+    - Optional semantic query cache for repeated / near-duplicate queries
     - No user configuration needed
     """
 
     # RRF constant (standard value from literature)
     RRF_K = 60
 
-    # UUID pattern for exact ID matching
-    UUID_PATTERN = re.compile(
-        r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
-        re.IGNORECASE
-    )
-
     def __init__(
         self,
         vector_store: VectorStore,
@@ -96,12 +225,14 @@ class HybridSearchService:
         semantic_weight: float = 1.0,
         keyword_weight: float = 1.0,
         exact_match_boost: float = 10.0,
+        cache: Optional[SemanticQueryCache] = None,
     ):
         self.vector_store = vector_store
         self.repository = repository
         self.semantic_weight = semantic_weight
         self.keyword_weight = keyword_weight
         self.exact_match_boost = exact_match_boost
+        self.cache = cache
 
     async def search(
         self,
@@ -130,43 +261,68 @@ class HybridSearchService:
         if query_type == QueryType.SHORT:
             keyword_w *= 1.5  # Boost keyword for short queries
 
-        # Run both searches
-        import asyncio
-        semantic_task = asyncio.create_task(
-            self.vector_store.search(query, limit=semantic_limit)
-        )
-        keyword_task = asyncio.create_task(
-            self.repository.search(query, limit=keyword_limit)
+        # Short queries with no letters (numbers, codes, punctuation) carry
+        # no semantic signal: skip the embedding and the vector search
+        use_semantic = not (
+            query_type == QueryType.SHORT
+            and not any(c.isalpha() for c in query)
         )
 
-        semantic_results = await semantic_task
-        keyword_results = await keyword_task
+        # Cached response for the same or a near-duplicate query; the
+        # embedding computed for the lookup is reused by the vector search
+        query_embedding = None
+        cache_params = (query_type, limit, semantic_limit, keyword_limit)
+        if self.cache is not None:
+            cached = self.cache.get_exact(query, cache_params)
+            if cached is not None:
+                return cached
+            if use_semantic:
+                query_embedding = await self.vector_store.embedding_service.embed_query(query)
+                cached = self.cache.get_similar(query, query_embedding, cache_params)
+                if cached is not None:
+                    return self._retarget_response(cached, query)
+
+        # Run both searches concurrently
+        if use_semantic:
+            semantic_results, keyword_results = await asyncio.gather(
+                self.vector_store.search(
+                    query, limit=semantic_limit, query_embedding=query_embedding
+                ),
+                self.repository.search(query, limit=keyword_limit),
+            )
+        else:
+            semantic_results = []
+            keyword_results = await self.repository.search(query, limit=keyword_limit)
 
-        # Merge using RRF
+        # Merge using RRF, boosting exact matches as results are built
         merged = self._merge_rrf(
             semantic_results=semantic_results,
             keyword_results=keyword_results,
             semantic_weight=semantic_w,
             keyword_weight=keyword_w,
+            query=query,
         )
 
-        # Check for exact matches and boost them
-        merged = self._boost_exact_matches(merged, query)
+        # Top results by hybrid score: partial selection, same order as a
+        # stable descending sort truncated to limit
+        top = heapq.nlargest(limit, merged, key=attrgetter("hybrid_score"))
 
-        # Sort by hybrid score and limit
-        merged.sort(key=lambda x: x.hybrid_score, reverse=True)
-
-        return HybridSearchResponse(
-            results=merged[:limit],
+        response = HybridSearchResponse(
+            results=top,
             query=query,
             query_type=query_type,
             total_semantic=len(semantic_results),
             total_keyword=len(keyword_results),
         )
 
+        if self.cache is not None:
+            self.cache.put(query, query_embedding, cache_params, response)
+
+        return response
+
     def _detect_query_type(self, query: str) -> QueryType:
         """Detect the type of query for optimal handling."""
-        if self.UUID_PATTERN.match(query):
+        if _is_uuid(query):
             return QueryType.EXACT_ID
 
         if (query.startswith('"') and query.endswith('"')) or \
@@ -192,6 +348,8 @@ class HybridSearchService:
                 is_exact_match=True,
                 from_keyword=True,
                 keywords=dataset.keywords,
+                organisation=dataset.organisation,
+                access_level=dataset.access_level,
             )
             results = [result]
         else:
@@ -226,6 +384,8 @@ class HybridSearchService:
                 is_exact_match=is_exact,
                 from_keyword=True,
                 keywords=dataset.keywords,
+                organisation=dataset.organisation,
+                access_level=dataset.access_level,
             ))
 
         return HybridSearchResponse(
@@ -242,57 +402,57 @@ class HybridSearchService:
         keyword_results: list[DatasetMetadata],
         semantic_weight: float,
         keyword_weight: float,
+        query: Optional[str] = None,
     ) -> list[HybridSearchResult]:
-        """Merge results using Reciprocal Rank Fusion."""
+        """
+        Merge results using Reciprocal Rank Fusion.
+
+        If query is given, exact-match boosts (see _boost_exact_matches)
+        are applied as each result is created, so no second pass is needed.
+        """
+        # One dict probe per row; new entries are built fully initialised
+        # rather than created empty and then patched attribute by attribute
+        k = self.RRF_K
         scores: dict[str, HybridSearchResult] = {}
+        boost = None
+        if query is not None:
+            boost = self._exact_boosts(query)
+        from_semantic = HybridSearchResult._from_semantic
+        from_keyword = HybridSearchResult._from_keyword
 
         # Process semantic results
         for rank, result in enumerate(semantic_results, start=1):
-            rrf_score = semantic_weight / (self.RRF_K + rank)
-
-            if result.dataset_id not in scores:
-                scores[result.dataset_id] = HybridSearchResult(
-                    dataset_id=result.dataset_id,
-                    title=result.title,
-                    abstract=result.abstract,
-                    hybrid_score=0,
-                    keywords=result.keywords,
-                    access_level=getattr(result, "access_level", "public"),
+            entry = scores.get(result.dataset_id)
+            if entry is None:
+                entry = scores[result.dataset_id] = from_semantic(
+                    result, semantic_weight / (k + rank), rank
                 )
-
-            scores[result.dataset_id].hybrid_score += rrf_score
-            scores[result.dataset_id].semantic_rank = rank
-            scores[result.dataset_id].from_semantic = True
+                if boost is not None:
+                    _apply_exact_boost(entry, *boost)
+            else:
+                entry.hybrid_score += semantic_weight / (k + rank)
+                entry.semantic_rank = rank
 
         # Process keyword results
         for rank, dataset in enumerate(keyword_results, start=1):
-            rrf_score = keyword_weight / (self.RRF_K + rank)
-
-            if dataset.identifier not in scores:
-                scores[dataset.identifier] = HybridSearchResult(
-                    dataset_id=dataset.identifier,
-                    title=dataset.title or "",
-                    abstract=dataset.abstract or "",
-                    hybrid_score=0,
-                    keywords=dataset.keywords,
-                    access_level=getattr(dataset, "access_level", "public"),
-                )
-
-            scores[dataset.identifier].hybrid_score += rrf_score
-            scores[dataset.identifier].keyword_rank = rank
-            scores[dataset.identifier].from_keyword = True
+            rrf_score = keyword_weight / (k + rank)
 
-            # Keyword results carry authoritative access_level from MongoDB
-            scores[dataset.identifier].access_level = getattr(
-                dataset, "access_level", "public"
-            )
-
-            # Extract organisation from responsible parties
-            if dataset.responsible_parties:
-                for party in dataset.responsible_parties:
-                    if party.organisation:
-                        scores[dataset.identifier].organisation = party.organisation
-                        break
+            entry = scores.get(dataset.identifier)
+            if entry is None:
+                entry = scores[dataset.identifier] = from_keyword(
+                    dataset, rrf_score, rank
+                )
+                if boost is not None:
+                    _apply_exact_boost(entry, *boost)
+            else:
+                entry.hybrid_score += rrf_score
+                entry.keyword_rank = rank
+                entry.from_keyword = True
+                # Keyword results carry authoritative access_level from MongoDB
+                entry.access_level = dataset.access_level
+                organisation = dataset.organisation
+                if organisation:
+                    entry.organisation = organisation
 
         return list(scores.values())
 
@@ -302,20 +462,37 @@ class HybridSearchService:
         query: str,
     ) -> list[HybridSearchResult]:
         """Boost results that exactly match query in title or ID."""
-        query_lower = query.lower()
-
+        boost = self._exact_boosts(query)
         for result in results:
-            if result.title and query_lower == result.title.lower():
-                result.hybrid_score += self.exact_match_boost
-                result.is_exact_match = True
-            elif result.title and query_lower in result.title.lower():
-                result.hybrid_score += self.exact_match_boost * 0.5
-
-            if any(query_lower == kw.lower() for kw in result.keywords):
-                result.hybrid_score += self.exact_match_boost * 0.3
-
+            _apply_exact_boost(result, *boost)
         return results
 
+    def _retarget_response(
+        self,
+        response: HybridSearchResponse,
+        query: str,
+    ) -> HybridSearchResponse:
+        """
+        Re-target a near-duplicate query's cached response at query.
+
+        The cached scores carry the exact-match boosts of the query they
+        were computed for; swap those for query's boosts and re-rank.
+        """
+        old_boost = self._exact_boosts(response.query)
+        new_boost = self._exact_boosts(query)
+        for result in response.results:
+            result.hybrid_score -= _exact_boost_amount(result, *old_boost)
+            result.is_exact_match = False
+            _apply_exact_boost(result, *new_boost)
+        response.results.sort(key=attrgetter("hybrid_score"), reverse=True)
+        response.query = query
+        return response
+
+    def _exact_boosts(self, query: str) -> tuple[str, float, float, float]:
+        """(query_lower, title, partial-title, keyword) boost arguments."""
+        title_boost = self.exact_match_boost
+        return query.lower(), title_boost, title_boost * 0.5, title_boost * 0.3
+
     # =========================================================================
     # Convenience Methods
     # =========================================================================
@@ -337,6 +514,7 @@ class HybridSearchService:
                 semantic_rank=i + 1,
                 from_semantic=True,
                 keywords=r.keywords,
+                access_level=r.access_level,
             )
             for i, r in enumerate(results)
         ]
@@ -358,6 +536,8 @@ class HybridSearchService:
                 keyword_rank=i + 1,
                 from_keyword=True,
                 keywords=d.keywords,
+                organisation=d.organisation,
+                access_level=d.access_level,
             )
             for i, d in enumerate(results)
         ]
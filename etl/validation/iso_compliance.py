@@ -24,12 +24,23 @@ RECOMMENDED_FIELDS = [
 
 # All fields used for scoring
 ALL_FIELDS = REQUIRED_FIELDS + RECOMMENDED_FIELDS
+_REQUIRED_SET = frozenset(REQUIRED_FIELDS)
+
+# Presence check per exact type: one dict lookup for the common cases
+_PRESENCE_CHECKS = {
+    str: lambda value: bool(value.strip()),
+    list: bool,
+    dict: bool,
+    type(None): lambda value: False,
+}
 
 
 def _is_present(value) -> bool:
     """Check if a field value is meaningfully present."""
-    if value is None:
-        return False
+    check = _PRESENCE_CHECKS.get(type(value))
+    if check is not None:
+        return check(value)
+    # Subclasses (e.g. str enums) fall through to the isinstance checks
     if isinstance(value, str) and not value.strip():
         return False
     if isinstance(value, list) and len(value) == 0:
@@ -54,8 +65,14 @@ def check_compliance(dataset: dict) -> dict:
             missing_recommended: list[str] — recommended fields that are missing
             warnings: list[str] — human-readable warnings
     """
-    missing_required = [f for f in REQUIRED_FIELDS if not _is_present(dataset.get(f))]
-    missing_recommended = [f for f in RECOMMENDED_FIELDS if not _is_present(dataset.get(f))]
+    missing_required = []
+    missing_recommended = []
+    for f in ALL_FIELDS:
+        if not _is_present(dataset.get(f)):
+            if f in _REQUIRED_SET:
+                missing_required.append(f)
+            else:
+                missing_recommended.append(f)
 
     present_count = len(ALL_FIELDS) - len(missing_required) - len(missing_recommended)
     score = round((present_count / len(ALL_FIELDS)) * 100) if ALL_FIELDS else 0
@@ -7,12 +7,20 @@ Steps:
      contain sensitive terms (protected species, embargoed, sensitive location).
   3. Promote one example to "admin_only" for demonstration.
 
+Steps 1 and 2 run as one pass: documents are streamed in batches, classified
+locally, and only those whose level changes are written with bulk_write.
+
 Run:
     python scripts/migrate_access_levels.py
+
+If the API runs with SEARCH_CACHE_TTL set, its cached search responses
+still carry the old access levels until they expire; restart the API (or
+wait out the TTL) after migrating.
 """
 
 import asyncio
 import os
+import re
 import sys
 
 # Allow importing from project root
@@ -23,6 +31,42 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import motor.motor_asyncio
+from pymongo import UpdateOne
+
+# Sensitive-term patterns per field, compiled once and evaluated locally
+_KEYWORDS_RE = re.compile("protected species", re.IGNORECASE)
+_ABSTRACT_RE = re.compile("embargoed|sensitive location", re.IGNORECASE)
+_TITLE_RE = re.compile("confidential|restricted", re.IGNORECASE)
+
+# Documents per cursor batch and per bulk_write
+_BATCH_SIZE = 1000
+
+
+def _matches(pattern: re.Pattern, value) -> bool:
+    """$regex semantics: match a string, or any string element of an array."""
+    if isinstance(value, str):
+        return pattern.search(value) is not None
+    if isinstance(value, list):
+        return any(isinstance(v, str) and pattern.search(v) for v in value)
+    return False
+
+
+def _is_sensitive(doc: dict) -> bool:
+    """Whether a dataset document mentions a sensitive term."""
+    return (
+        _matches(_KEYWORDS_RE, doc.get("keywords"))
+        or _matches(_ABSTRACT_RE, doc.get("abstract"))
+        or _matches(_TITLE_RE, doc.get("title"))
+    )
+
+
+async def _flush(collection, ops: list) -> int:
+    """Write and clear pending updates; returns the modified count."""
+    if not ops:
+        return 0
+    result = await collection.bulk_write(ops, ordered=False)
+    ops.clear()
+    return result.modified_count
 
 
 async def migrate():
@@ -35,29 +79,30 @@ async def migrate():
     collection = db[collection_name]
 
     # -------------------------------------------------------------------------
-    # Step 1: Set all documents to "public" (idempotent)
-    # -------------------------------------------------------------------------
-    result = await collection.update_many(
-        {},
-        {"$set": {"access_level": "public"}},
-    )
-    print(f"Step 1: Set {result.modified_count} documents to access_level='public'")
-
-    # -------------------------------------------------------------------------
-    # Step 2: Set "restricted" for sensitive datasets
+    # Steps 1 + 2: classify each document in Python and bulk-write only the
+    # ones whose access_level changes, in batches (idempotent, so an
+    # interrupted run can simply be restarted)
     # -------------------------------------------------------------------------
-    sensitive_filter = {
-        "$or": [
-            {"keywords": {"$regex": "protected species", "$options": "i"}},
-            {"abstract": {"$regex": "embargoed|sensitive location", "$options": "i"}},
-            {"title": {"$regex": "confidential|restricted", "$options": "i"}},
-        ]
-    }
-    result = await collection.update_many(
-        sensitive_filter,
-        {"$set": {"access_level": "restricted"}},
-    )
-    print(f"Step 2: Set {result.modified_count} documents to access_level='restricted'")
+    projection = {"title": 1, "abstract": 1, "keywords": 1, "access_level": 1}
+    counts = {"public": 0, "restricted": 0}
+    ops = []
+    scanned = modified = 0
+
+    async for doc in collection.find({}, projection).batch_size(_BATCH_SIZE):
+        level = "restricted" if _is_sensitive(doc) else "public"
+        counts[level] += 1
+        scanned += 1
+        if doc.get("access_level") != level:
+            ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"access_level": level}}))
+
+        if len(ops) >= _BATCH_SIZE:
+            modified += await _flush(collection, ops)
+            print(f"  ... scanned {scanned}, updated {modified}")
+
+    modified += await _flush(collection, ops)
+    print(f"Step 1: Classified {counts['public']} documents as access_level='public'")
+    print(f"Step 2: Classified {counts['restricted']} documents as access_level='restricted'")
+    print(f"        ({modified} documents updated)")
 
     # -------------------------------------------------------------------------
     # Step 3: Promote first restricted doc to "admin_only" as example
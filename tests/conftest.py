@@ -3,6 +3,17 @@
 import pytest
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _fast_bcrypt():
+    """Hash passwords at the minimum bcrypt cost (4) for the test session."""
+    from api.auth import service
+
+    original = service.pwd_context
+    service.pwd_context = original.copy(bcrypt__rounds=4)
+    yield
+    service.pwd_context = original
+
+
 @pytest.fixture
 def sample_dataset():
     """Sample dataset for testing."""
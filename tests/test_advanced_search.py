@@ -163,6 +163,46 @@ class TestAdvancedSearchPipeline:
         result = self.pipeline.search("river", hybrid)
         assert result.reranked is False
 
+    def test_rerank_skipped_for_exact_title_match(self):
+        class FailingReranker:
+            def rerank(self, query, results, top_n=10):
+                raise AssertionError("reranker should not run")
+
+        pipeline = AdvancedSearchPipeline(use_reranker=False)
+        pipeline.use_reranker = True
+        pipeline._reranker = FailingReranker()
+        hybrid = [
+            make_result("a", "flux tower", score=0.03),
+            make_result("b", "rainfall radar", score=0.03),
+        ]
+        result = pipeline.search("flux tower", hybrid)
+        assert result.results[0].dataset_id == "a"
+        assert result.reranked is False
+
+
+# =============================================================================
+# CrossEncoderReranker model cache
+# =============================================================================
+
+class TestRerankerModelCache:
+    def test_rerankers_share_one_model(self, monkeypatch):
+        from etl.search import advanced
+
+        loads = []
+        monkeypatch.setattr(advanced, "_MODEL_CACHE", {})
+        monkeypatch.setattr(
+            CrossEncoderReranker, "_create_model",
+            lambda self: loads.append(self.model_name) or object(),
+        )
+
+        first = CrossEncoderReranker("some/model")
+        second = CrossEncoderReranker("some/model")
+        first._load_model()
+        second._load_model()
+
+        assert loads == ["some/model"]
+        assert first._model is second._model
+
 
 # =============================================================================
 # CrossEncoderReranker — skipped if model unavailable
@@ -1,5 +1,7 @@
 """Tests for authentication system."""
 
+import functools
+
 import pytest
 from unittest.mock import AsyncMock, patch
 from datetime import datetime, timezone
@@ -12,6 +14,12 @@ from api.auth.service import (
 )
 
 
+@functools.lru_cache(maxsize=32)
+def _cached_hash(password: str) -> str:
+    """bcrypt hash computed once per password (tests that don't check salts)."""
+    return hash_password(password)
+
+
 # =============================================================================
 # Password Hashing
 # =============================================================================
@@ -102,7 +110,7 @@ class TestAuthEndpoints:
         repo.create = AsyncMock(return_value={
             "_id": "user@test.com",
             "email": "user@test.com",
-            "hashed_password": hash_password("testpass123"),
+            "hashed_password": _cached_hash("testpass123"),
             "role": "researcher",
             "created_at": datetime.now(timezone.utc),
         })
@@ -142,7 +150,7 @@ class TestAuthEndpoints:
     @pytest.mark.asyncio
     async def test_login_success(self, mock_user_repo):
         """Test successful login flow."""
-        stored_hash = hash_password("testpass123")
+        stored_hash = _cached_hash("testpass123")
         mock_user_repo.get_by_email.return_value = {
             "_id": "user@test.com",
             "email": "user@test.com",
@@ -162,7 +170,7 @@ class TestAuthEndpoints:
     @pytest.mark.asyncio
     async def test_login_wrong_password(self, mock_user_repo):
         """Test login with wrong password."""
-        stored_hash = hash_password("correctpassword")
+        stored_hash = _cached_hash("correctpassword")
         mock_user_repo.get_by_email.return_value = {
             "_id": "user@test.com",
             "email": "user@test.com",
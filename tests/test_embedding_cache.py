@@ -0,0 +1,93 @@
+"""Unit tests for etl/embeddings/cache.py"""
+
+import threading
+
+import pytest
+
+from etl.embeddings import CachedEmbeddingService, EmbeddingService
+
+
+class CountingEmbeddingService(EmbeddingService):
+    """Deterministic embedding service that counts model calls."""
+
+    def __init__(self, model_name="test-model"):
+        self._model_name = model_name
+        self.calls = 0
+
+    @property
+    def model_name(self):
+        return self._model_name
+
+    @property
+    def dimensions(self):
+        return 3
+
+    async def embed_query(self, text):
+        self.calls += 1
+        return [float(len(text)), 0.5, -0.25]
+
+    async def embed_batch(self, texts):
+        return [await self.embed_query(t) for t in texts]
+
+
+class TestCachedEmbeddingService:
+    @pytest.mark.asyncio
+    async def test_repeat_query_hits_cache(self, tmp_path):
+        inner = CountingEmbeddingService()
+        service = CachedEmbeddingService(inner, tmp_path / "emb.sqlite")
+
+        first = await service.embed_query("river")
+        second = await service.embed_query("river")
+
+        assert inner.calls == 1
+        assert second == pytest.approx(first, rel=1e-3)
+        assert (service.hits, service.misses) == (1, 1)
+        service.close()
+
+    @pytest.mark.asyncio
+    async def test_cache_survives_reopen(self, tmp_path):
+        path = tmp_path / "emb.sqlite"
+        service = CachedEmbeddingService(CountingEmbeddingService(), path)
+        await service.embed_query("soil carbon")
+        service.close()
+
+        inner = CountingEmbeddingService()
+        reopened = CachedEmbeddingService(inner, path)
+        assert await reopened.embed_query("soil carbon") == [11.0, 0.5, -0.25]
+        assert inner.calls == 0
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_entries_are_namespaced_by_model(self, tmp_path):
+        path = tmp_path / "emb.sqlite"
+        service = CachedEmbeddingService(CountingEmbeddingService("model-a"), path)
+        await service.embed_query("peat")
+        service.close()
+
+        inner = CountingEmbeddingService("model-b")
+        other = CachedEmbeddingService(inner, path)
+        await other.embed_query("peat")
+        assert inner.calls == 1
+        other.close()
+
+    @pytest.mark.asyncio
+    async def test_sqlite_calls_run_off_the_event_loop(self, tmp_path):
+        service = CachedEmbeddingService(
+            CountingEmbeddingService(), tmp_path / "emb.sqlite"
+        )
+        loop_thread = threading.get_ident()
+        threads = []
+        for name in ("_get", "_put"):
+            original = getattr(service, name)
+
+            def record(*args, _original=original):
+                threads.append(threading.get_ident())
+                return _original(*args)
+
+            setattr(service, name, record)
+
+        await service.embed_query("moorland")
+
+        assert len(threads) == 2
+        assert loop_thread not in threads
+        service.close()
@@ -6,8 +6,11 @@ Includes:
 - Integration tests against real CEH API (optional)
 - Error handling tests
 """
+import asyncio
+import gc
 import json
 import pytest
+import warnings
 import zipfile
 from datetime import timedelta
 from pathlib import Path
@@ -24,7 +27,15 @@ from etl.resources import (
     FetchResult,
     ResourceMetadata,
     ResourceType,
+    cache_stats,
+    clear_cache,
+    close_http_session,
+    close_zip_handles,
+    extract_zip_to_directory,
+    fetch_many,
+    migrate_shard_depth,
 )
+from etl.resources.http import _get_session
 
 
 # =============================================================================
@@ -248,6 +259,51 @@ class TestZipEntryResource:
         data = json.loads(result.text)
         assert data["id"] == "test-123"
     
+    @pytest.mark.asyncio
+    async def test_read_deflated_entry(self, tmp_path):
+        """Test reading a compressed entry matches zipfile's output."""
+        zip_path = tmp_path / "deflated.zip"
+        payload = b'{"title": "Deflated"}' * 500
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("big.json", payload)
+        
+        result = await ZipEntryResource(zip_path, "big.json").fetch()
+        
+        assert result.success
+        assert result.content == payload
+    
+    @pytest.mark.asyncio
+    async def test_entries_share_archive_handle(self, test_zip):
+        """Test entries reuse one open archive and see rewrites."""
+        from etl.resources.local import _ZIP_HANDLES
+        
+        close_zip_handles()
+        for resource in ZipEntryResource.from_zip(test_zip):
+            assert (await resource.fetch()).success
+        assert len(_ZIP_HANDLES) == 1
+        
+        with zipfile.ZipFile(test_zip, "w") as zf:
+            zf.writestr("readme.txt", "Rewritten readme, new length")
+        
+        result = await ZipEntryResource(test_zip, "readme.txt").fetch()
+        assert result.text == "Rewritten readme, new length"
+        close_zip_handles()
+    
+    @pytest.mark.asyncio
+    async def test_extract_to_directory(self, test_zip, tmp_path):
+        """Test extraction writes every filtered entry."""
+        out = tmp_path / "out"
+        
+        extracted = await extract_zip_to_directory(
+            test_zip, out, filter_func=lambda e: not e.endswith(".pdf")
+        )
+        
+        assert sorted(p.relative_to(out).as_posix() for p in extracted) == [
+            "data/metadata.json",
+            "readme.txt",
+        ]
+        assert (out / "readme.txt").read_text() == "This is a readme file"
+    
     @pytest.mark.asyncio
     async def test_entry_not_found(self, test_zip):
         """Test error for missing ZIP entry."""
@@ -309,7 +365,7 @@ class TestHttpResource:
             success=True,
         )
         
-        with patch.object(resource, '_single_fetch', new_callable=AsyncMock) as mock_fetch:
+        with patch.object(type(resource), '_single_fetch', new_callable=AsyncMock) as mock_fetch:
             mock_fetch.return_value = mock_result
             
             result = await resource.fetch()
@@ -333,7 +389,7 @@ class TestHttpResource:
             error="HTTP 404: Not Found",
         )
         
-        with patch.object(resource, '_single_fetch', new_callable=AsyncMock) as mock_fetch:
+        with patch.object(type(resource), '_single_fetch', new_callable=AsyncMock) as mock_fetch:
             mock_fetch.return_value = mock_result
             
             result = await resource.fetch()
@@ -363,7 +419,7 @@ class TestHttpResource:
             success=True,
         )
         
-        with patch.object(resource, '_single_fetch', new_callable=AsyncMock) as mock_fetch:
+        with patch.object(type(resource), '_single_fetch', new_callable=AsyncMock) as mock_fetch:
             mock_fetch.side_effect = [fail_result, fail_result, success_result]
             
             result = await resource.fetch()
@@ -371,6 +427,63 @@ class TestHttpResource:
             assert result.success
             assert mock_fetch.call_count == 3  # Retried twice
     
+    @pytest.mark.asyncio
+    async def test_retry_honours_retry_after(self):
+        """Test 429 retries wait for Retry-After rather than backoff."""
+        resource = HttpResource(
+            "https://example.com/limited.json",
+            max_retries=2,
+            retry_delay=60.0,
+        )
+        
+        limited = FetchResult(
+            content=b"",
+            metadata=ResourceMetadata(
+                extra={"status_code": 429, "retry_after": 0.02}
+            ),
+            success=False,
+            error="HTTP 429: Too Many Requests",
+        )
+        ok = FetchResult(content=b"{}", metadata=ResourceMetadata())
+        
+        with patch.object(type(resource), '_single_fetch', new_callable=AsyncMock) as mock_fetch, \
+                patch("etl.resources.http.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            mock_fetch.side_effect = [limited, ok]
+            
+            result = await resource.fetch()
+            
+            assert result.success
+            (delay,), _ = mock_sleep.call_args
+            assert 0.02 <= delay <= 0.025
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_capped(self):
+        """Test a huge Retry-After is clamped to MAX_RETRY_AFTER."""
+        resource = HttpResource(
+            "https://example.com/limited.json",
+            max_retries=2,
+        )
+
+        limited = FetchResult(
+            content=b"",
+            metadata=ResourceMetadata(
+                extra={"status_code": 503, "retry_after": 86400.0}
+            ),
+            success=False,
+            error="HTTP 503: Service Unavailable",
+        )
+        ok = FetchResult(content=b"{}", metadata=ResourceMetadata())
+
+        with patch.object(type(resource), '_single_fetch', new_callable=AsyncMock) as mock_fetch, \
+                patch("etl.resources.http.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            mock_fetch.side_effect = [limited, ok]
+
+            result = await resource.fetch()
+
+            assert result.success
+            (delay,), _ = mock_sleep.call_args
+            assert delay == HttpResource.MAX_RETRY_AFTER
+
     @pytest.mark.asyncio
     async def test_no_retry_on_404(self):
         """Test that 404 doesn't trigger retry."""
@@ -386,7 +499,7 @@ class TestHttpResource:
             error="HTTP 404: Not Found",
         )
         
-        with patch.object(resource, '_single_fetch', new_callable=AsyncMock) as mock_fetch:
+        with patch.object(type(resource), '_single_fetch', new_callable=AsyncMock) as mock_fetch:
             mock_fetch.return_value = not_found_result
             
             result = await resource.fetch()
@@ -399,6 +512,149 @@ class TestHttpResource:
         with pytest.raises(ValueError, match="Invalid URL scheme"):
             HttpResource("ftp://example.com/file.txt")
 
+    @pytest.mark.asyncio
+    async def test_stream_yields_body_chunks(self):
+        """Test streaming reads the body incrementally from the server."""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        body = b"x" * 300_000
+
+        async def handler(request):
+            return web.Response(body=body)
+
+        app = web.Application()
+        app.router.add_get("/big.zip", handler)
+
+        async with TestServer(app) as server:
+            resource = HttpResource(str(server.make_url("/big.zip")))
+            chunks = [c async for c in resource.stream(chunk_size=65536)]
+            await close_http_session()
+
+        assert b"".join(chunks) == body
+        assert all(len(c) <= 65536 for c in chunks)
+
+    @pytest.mark.asyncio
+    async def test_cached_entry_revalidated_with_etag(self, tmp_path):
+        """Test an expired cache entry is revalidated via If-None-Match."""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        seen = []
+
+        async def handler(request):
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304, headers={"ETag": '"v1"'})
+            return web.Response(body=b"payload", headers={"ETag": '"v1"'})
+
+        app = web.Application()
+        app.router.add_get("/doc", handler)
+
+        async with TestServer(app) as server:
+            cached = CachedResource(
+                HttpResource(str(server.make_url("/doc"))),
+                cache_dir=tmp_path / "cache",
+                ttl=timedelta(0),
+            )
+            first = await cached.fetch()
+            CachedResource._MEM_CACHE.clear()
+            second = await cached.fetch()
+            await close_http_session()
+
+        assert seen == [None, '"v1"']
+        assert first.content == b"payload"
+        assert second.content == b"payload"
+        assert second.from_cache
+
+    @pytest.mark.asyncio
+    async def test_recent_response_answers_exists(self):
+        """Test exists()/get_metadata() reuse a recent response."""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        methods = []
+
+        async def handler(request):
+            methods.append(request.method)
+            return web.Response(body=b"{}", content_type="application/json")
+
+        app = web.Application()
+        app.router.add_get("/doc", handler)
+
+        async with TestServer(app) as server:
+            resource = HttpResource(str(server.make_url("/doc")))
+            await resource.fetch()
+            assert await resource.exists()
+            metadata = await resource.get_metadata()
+            await close_http_session()
+
+        assert methods == ["GET"]
+        assert metadata.is_json
+
+    @pytest.mark.asyncio
+    async def test_probe_cache_is_isolated_from_callers(self):
+        """Test mutating fetched or probed metadata leaves the probe cache intact."""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        async def handler(request):
+            return web.Response(body=b"{}", content_type="application/json")
+
+        app = web.Application()
+        app.router.add_get("/doc", handler)
+
+        async with TestServer(app) as server:
+            resource = HttpResource(str(server.make_url("/doc")))
+            result = await resource.fetch()
+            result.metadata.extra["status_code"] = 500
+            first = await resource.get_metadata()
+            first.extra["status_code"] = 500
+            assert await resource.exists()
+            await close_http_session()
+
+    @pytest.mark.asyncio
+    async def test_session_shared_within_loop(self):
+        """Test that fetches on one loop share a pooled session."""
+        session = _get_session()
+        assert _get_session() is session
+
+        await close_http_session()
+        assert session.closed
+        assert _get_session() is not session
+        await close_http_session()
+
+    def test_sessions_not_retained_across_loops(self):
+        """Test closed and finished loops leave no pooled sessions behind."""
+        from etl.resources.http import _SESSIONS
+
+        async def closed_run():
+            _get_session()
+            await close_http_session()
+
+        for _ in range(3):
+            asyncio.run(closed_run())
+        assert not _SESSIONS
+
+        async def leaked_run():
+            return _get_session()
+
+        leaked = asyncio.run(leaked_run())
+        assert len(_SESSIONS) == 1
+
+        async def next_run():
+            _get_session()
+            assert len(_SESSIONS) == 1
+            await close_http_session()
+
+        asyncio.run(next_run())
+        assert not _SESSIONS
+        # The leaked session's loop is gone, so it can only be dropped
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", ResourceWarning)
+            del leaked
+            gc.collect()
+
 
 # =============================================================================
 # CEH Catalogue Resource Tests
@@ -473,7 +729,7 @@ class TestCEHCatalogueResource:
             success=True,
         )
         
-        with patch.object(resource, '_single_fetch', new_callable=AsyncMock) as mock_fetch:
+        with patch.object(type(resource), '_single_fetch', new_callable=AsyncMock) as mock_fetch:
             mock_fetch.return_value = mock_result
             
             result = await resource.fetch()
@@ -530,7 +786,46 @@ class TestCachedResource:
         assert result2.success
         assert result2.from_cache
         assert result2.text == '{"cached": false}'  # Original content
-    
+
+    @pytest.mark.asyncio
+    async def test_memory_hits_do_not_share_extra(self, tmp_path):
+        """Test mutating a returned result's extra leaves later hits intact."""
+        source_path = tmp_path / "source.json"
+        source_path.write_text("{}")
+
+        cached = CachedResource(
+            LocalFileResource(source_path), cache_dir=tmp_path / "cache"
+        )
+        first = await cached.fetch()
+        first.metadata.extra["tampered"] = True
+
+        second = await cached.fetch()
+        second.metadata.extra["tampered"] = True
+
+        third = await cached.fetch()
+        assert "tampered" not in third.metadata.extra
+
+    @pytest.mark.asyncio
+    async def test_memory_hit_uses_reader_ttl(self, tmp_path):
+        """Test a memo entry written under a long TTL expires for a short-TTL reader."""
+        source_path = tmp_path / "source.txt"
+        source_path.write_text("version 1")
+        cache_dir = tmp_path / "cache"
+
+        writer = CachedResource(
+            LocalFileResource(source_path), cache_dir=cache_dir, ttl=None
+        )
+        await writer.fetch()
+        source_path.write_text("version 2")
+
+        reader = CachedResource(
+            LocalFileResource(source_path),
+            cache_dir=cache_dir,
+            ttl=timedelta(seconds=0),
+        )
+        result = await reader.fetch()
+        assert result.text == "version 2"
+
     @pytest.mark.asyncio
     async def test_cache_ttl_expiry(self, tmp_path):
         """Test that expired cache is refreshed."""
@@ -627,6 +922,180 @@ class TestCachedResource:
         assert info["cached"]
         assert info["valid"]
 
+    @pytest.mark.asyncio
+    async def test_memory_cache_skips_disk(self, tmp_path):
+        """Test recently cached entries are served from memory."""
+        source_path = tmp_path / "source.txt"
+        source_path.write_text("content")
+
+        cache_dir = tmp_path / "cache"
+
+        inner = LocalFileResource(source_path)
+        cached = CachedResource(inner, cache_dir=cache_dir)
+        await cached.fetch()
+
+        # Remove the blob behind the cache's back
+        for blob in cache_dir.rglob("*.blob"):
+            blob.unlink()
+
+        result = await cached.fetch()
+        assert result.from_cache
+        assert result.text == "content"
+
+    @pytest.mark.asyncio
+    async def test_stream_from_cache(self, tmp_path):
+        """Test streaming a cached entry yields the original content."""
+        source_path = tmp_path / "source.txt"
+        source_path.write_text("abcdefghij" * 10)
+
+        cache_dir = tmp_path / "cache"
+
+        inner = LocalFileResource(source_path)
+        cached = CachedResource(inner, cache_dir=cache_dir)
+        await cached.fetch()
+
+        # Change source and drop the memory copy so chunks come from the blob
+        source_path.write_text("changed")
+        CachedResource._MEM_CACHE.clear()
+
+        chunks = [chunk async for chunk in cached.stream(chunk_size=16)]
+        assert b"".join(chunks) == b"abcdefghij" * 10
+        assert max(len(c) for c in chunks) == 16
+
+    @pytest.mark.asyncio
+    async def test_migrate_shard_depth(self, tmp_path):
+        """Test re-sharding keeps existing entries reachable."""
+        source_path = tmp_path / "source.txt"
+        source_path.write_text("content")
+
+        cache_dir = tmp_path / "cache"
+
+        inner = LocalFileResource(source_path)
+        old = CachedResource(inner, cache_dir=cache_dir, shard_hex_chars=2)
+        await old.fetch()
+
+        moved = await migrate_shard_depth(cache_dir, cache_dir, new_depth=3)
+        assert moved == 1
+
+        source_path.write_text("changed")
+        new = CachedResource(inner, cache_dir=cache_dir, shard_hex_chars=3)
+        result = await new.fetch()
+        assert result.from_cache
+        assert result.text == "content"
+
+    @pytest.mark.asyncio
+    async def test_migrate_into_seeded_dir_stays_reachable(self, tmp_path):
+        """Test entries migrated into a directory with a seeded filter are hits."""
+        from etl.resources.cached import _CacheKeyBloom
+
+        source_path = tmp_path / "source.txt"
+        source_path.write_text("content")
+        old_dir, new_dir = tmp_path / "old", tmp_path / "new"
+        inner = LocalFileResource(source_path)
+
+        await CachedResource(inner, cache_dir=old_dir).fetch()
+        waiting = CachedResource(inner, cache_dir=new_dir)
+        assert _CacheKeyBloom.for_dir(new_dir)._ready.wait(5)
+
+        await migrate_shard_depth(old_dir, new_dir)
+        CachedResource._MEM_CACHE.clear()
+        source_path.write_text("changed")
+
+        result = await waiting.fetch()
+        assert result.from_cache
+        assert result.text == "content"
+
+    def test_bloom_stays_permissive_for_unsharded_blobs(self, tmp_path):
+        """Test top-level blobs keep the filter from claiming misses."""
+        from etl.resources.cached import BLOB_SUFFIX, _CacheKeyBloom
+
+        key = "ab" * 32
+        (tmp_path / f"{key}{BLOB_SUFFIX}").write_bytes(b"")
+
+        bloom = _CacheKeyBloom()
+        bloom._populate(str(tmp_path))
+
+        assert not bloom._ready.is_set()
+        assert bloom.might_contain(key)
+
+    @pytest.mark.asyncio
+    async def test_shard_depth_out_of_range_rejected(self, tmp_path):
+        """Test unsharded or over-long shard depths raise ValueError."""
+        inner = LocalFileResource(tmp_path / "source.txt")
+
+        for depth in (0, 65):
+            with pytest.raises(ValueError, match="Shard depth"):
+                CachedResource(inner, cache_dir=tmp_path, shard_hex_chars=depth)
+            with pytest.raises(ValueError, match="Shard depth"):
+                await migrate_shard_depth(tmp_path, tmp_path, new_depth=depth)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_coalesce(self, tmp_path):
+        """Test concurrent cold fetches hit the source only once."""
+        source_path = tmp_path / "source.txt"
+        source_path.write_text("content")
+
+        cache_dir = tmp_path / "cache"
+
+        inner = LocalFileResource(source_path)
+        original_fetch = inner.fetch
+        calls = 0
+
+        async def counting_fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return await original_fetch()
+
+        inner.fetch = counting_fetch
+        cached = CachedResource(inner, cache_dir=cache_dir)
+
+        results = await asyncio.gather(*(cached.fetch() for _ in range(5)))
+        assert calls == 1
+        assert all(r.success and r.text == "content" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_json_cache_round_trip(self, tmp_path):
+        """Test JSON entries (compressed when zstandard is installed) read back intact."""
+        payload = json.dumps({"items": ["climate"] * 500})
+        source_path = tmp_path / "source.json"
+        source_path.write_text(payload)
+
+        cache_dir = tmp_path / "cache"
+
+        inner = LocalFileResource(source_path)
+        cached = CachedResource(inner, cache_dir=cache_dir)
+        await cached.fetch()
+        CachedResource._MEM_CACHE.clear()
+
+        result = await cached.fetch()
+        assert result.from_cache
+        assert result.text == payload
+
+        chunks = [chunk async for chunk in cached.stream(chunk_size=64)]
+        assert b"".join(chunks).decode() == payload
+
+    @pytest.mark.asyncio
+    async def test_cache_entry_is_single_blob(self, tmp_path):
+        """Test metadata and content are stored in one file per entry."""
+        source_path = tmp_path / "source.txt"
+        source_path.write_text("content")
+
+        cache_dir = tmp_path / "cache"
+
+        inner = LocalFileResource(source_path)
+        cached = CachedResource(inner, cache_dir=cache_dir)
+        await cached.fetch()
+
+        files = [p for p in cache_dir.rglob("*") if p.is_file()]
+        assert len(files) == 1
+        assert files[0].suffix == ".blob"
+
+        stats = await cache_stats(cache_dir)
+        assert stats["entries"] == 1
+
+        assert await clear_cache(cache_dir) == 1
+
 
 # =============================================================================
 # Resource Factory Tests
@@ -661,6 +1130,46 @@ class TestResourceFactory:
         
         assert isinstance(resource, CEHCatalogueResource)
     
+    def test_ceh_url_format_from_query_string(self):
+        """Test format is read from the query, ignoring other parameters."""
+        factory = ResourceFactory(enable_caching=False)
+        
+        url = (
+            "https://catalogue.ceh.ac.uk/id/"
+            "f710bed1-e564-47bf-b82c-4c2a2fe2810e.xml?x=format=ttl&format=gemini"
+        )
+        resource = factory.create(url)
+        
+        assert isinstance(resource, CEHCatalogueResource)
+        assert resource.dataset_id == "f710bed1-e564-47bf-b82c-4c2a2fe2810e"
+        assert resource.format == "gemini"
+    
+    def test_creates_supporting_docs_resource_for_zip_url(self):
+        """Test factory extracts the dataset ID from a supporting docs URL."""
+        factory = ResourceFactory(enable_caching=False)
+        
+        url = "https://data-package.ceh.ac.uk/sd/f710bed1-e564-47bf-b82c-4c2a2fe2810e.zip"
+        resource = factory.create(url)
+        
+        assert isinstance(resource, CEHSupportingDocsResource)
+        assert resource.dataset_id == "f710bed1-e564-47bf-b82c-4c2a2fe2810e"
+    
+    @pytest.mark.asyncio
+    async def test_fetch_many_preserves_order(self, tmp_path):
+        """Test batch fetch returns results in input order."""
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"f{i}.txt"
+            path.write_text(str(i))
+            paths.append(path)
+        
+        factory = ResourceFactory(enable_caching=False)
+        results = await fetch_many(
+            (factory.file(p) for p in paths), concurrency=2
+        )
+        
+        assert [r.content for r in results] == [b"0", b"1", b"2", b"3", b"4"]
+    
     def test_wraps_with_cache_when_enabled(self, tmp_path):
         """Test factory wraps resources with cache."""
         factory = ResourceFactory(
@@ -2,6 +2,8 @@
 Tests for hybrid search service.
 """
 
+import dataclasses
+
 import pytest
 from unittest.mock import Mock, AsyncMock
 
@@ -10,9 +12,10 @@ from etl.search import (
     HybridSearchResult,
     HybridSearchResponse,
     QueryType,
+    SemanticQueryCache,
 )
 from etl.embeddings import SearchResult as SemanticResult
-from etl.models import DatasetMetadata
+from etl.models import DatasetMetadata, ResponsibleParty
 
 
 # =============================================================================
@@ -100,6 +103,15 @@ class TestQueryTypeDetection:
         
         assert result == QueryType.EXACT_ID
     
+    def test_uuid_like_strings_are_not_ids(self, search_service):
+        """Test near-UUIDs fall through to normal detection."""
+        for query in (
+            "f710bed1e56447bfb82c4c2a2fe2810e-----",
+            "+710bed1-e564-47bf-b82c-4c2a2fe2810e",
+            "f710bed1-e564-47bf-b82c-4c2a2fe2810g",
+        ):
+            assert search_service._detect_query_type(query) == QueryType.SHORT
+    
     def test_detect_quoted_title(self, search_service):
         """Test quoted string detection."""
         query = '"UK Drought Inventory"'
@@ -147,6 +159,26 @@ class TestExactMatchSearch:
         assert response.results[0].is_exact_match is True
         assert response.query_type == QueryType.EXACT_ID
     
+    @pytest.mark.asyncio
+    async def test_exact_id_carries_access_and_organisation(
+        self, search_service, mock_repository
+    ):
+        """Test exact ID results keep access level and organisation."""
+        mock_repository.get.return_value = DatasetMetadata(
+            identifier="test-uuid-123",
+            title="Test Dataset",
+            access_level="restricted",
+            responsible_parties=[
+                ResponsibleParty(name="A. Person"),
+                ResponsibleParty(organisation="UKCEH"),
+            ],
+        )
+        
+        response = await search_service._exact_id_search("test-uuid-123")
+        
+        assert response.results[0].access_level == "restricted"
+        assert response.results[0].organisation == "UKCEH"
+    
     @pytest.mark.asyncio
     async def test_exact_id_not_found(self, search_service, mock_repository):
         """Test exact ID lookup when not found."""
@@ -273,6 +305,33 @@ class TestExactMatchBoost:
         boosted = search_service._boost_exact_matches(results, "drought")
         
         assert boosted[0].hybrid_score > 0.5
+    
+    def test_merge_with_query_matches_separate_boost(
+        self, search_service, sample_semantic_results, sample_keyword_results
+    ):
+        """Test boosting during the merge equals merging then boosting."""
+        fused = search_service._merge_rrf(
+            semantic_results=sample_semantic_results,
+            keyword_results=sample_keyword_results,
+            semantic_weight=1.0,
+            keyword_weight=1.0,
+            query="Rainfall Patterns",
+        )
+        separate = search_service._boost_exact_matches(
+            search_service._merge_rrf(
+                semantic_results=sample_semantic_results,
+                keyword_results=sample_keyword_results,
+                semantic_weight=1.0,
+                keyword_weight=1.0,
+            ),
+            "Rainfall Patterns",
+        )
+        
+        assert [(r.dataset_id, r.is_exact_match) for r in fused] == [
+            (r.dataset_id, r.is_exact_match) for r in separate
+        ]
+        for a, b in zip(fused, separate):
+            assert a.hybrid_score == pytest.approx(b.hybrid_score)
 
 
 # =============================================================================
@@ -319,6 +378,23 @@ class TestHybridSearch:
         
         assert len(response.results) <= 1
     
+    @pytest.mark.asyncio
+    async def test_numeric_short_query_skips_semantic(
+        self,
+        search_service,
+        mock_vector_store,
+        mock_repository,
+        sample_keyword_results,
+    ):
+        """Test that a letterless short query only runs keyword search."""
+        mock_repository.search.return_value = sample_keyword_results
+        
+        response = await search_service.search("2019")
+        
+        mock_vector_store.search.assert_not_called()
+        assert response.total_semantic == 0
+        assert response.total_keyword == 2
+    
     @pytest.mark.asyncio
     async def test_uuid_triggers_exact_lookup(
         self,
@@ -340,6 +416,166 @@ class TestHybridSearch:
         mock_repository.get.assert_called_once()
 
 
+# =============================================================================
+# Semantic Query Cache Tests
+# =============================================================================
+
+def make_response(query="drought", score=0.5):
+    return HybridSearchResponse(
+        results=[
+            HybridSearchResult(
+                dataset_id="id-1",
+                title="UK Drought Data",
+                abstract="...",
+                hybrid_score=score,
+            )
+        ],
+        query=query,
+        query_type=QueryType.SHORT,
+        total_semantic=1,
+        total_keyword=0,
+    )
+
+
+class TestSemanticQueryCache:
+    """Tests for the semantic query cache."""
+
+    def test_exact_hit_ignores_case_and_spacing(self):
+        cache = SemanticQueryCache()
+        cache.put("UK drought", [1.0, 0.0], 10, make_response("UK drought"))
+
+        hit = cache.get_exact("  uk   DROUGHT ", 10)
+
+        assert hit is not None
+        assert hit.query == "  uk   DROUGHT "
+        assert hit.results[0].dataset_id == "id-1"
+
+    def test_hit_is_a_copy(self):
+        cache = SemanticQueryCache()
+        cache.put("drought", None, 10, make_response())
+
+        cache.get_exact("drought", 10).results[0].hybrid_score += 5
+
+        assert cache.get_exact("drought", 10).results[0].hybrid_score == 0.5
+
+    def test_similar_embedding_hits(self):
+        cache = SemanticQueryCache(similarity_threshold=0.9)
+        cache.put("drought", [1.0, 0.0], 10, make_response())
+
+        hit = cache.get_similar("droughts", [0.99, 0.05], 10)
+
+        assert hit is not None
+        assert hit.query == "drought"  # caller re-targets the matched entry
+        assert cache.get_similar("rainfall", [0.0, 1.0], 10) is None
+
+    def test_params_must_match(self):
+        cache = SemanticQueryCache()
+        cache.put("drought", [1.0, 0.0], 10, make_response())
+
+        assert cache.get_exact("drought", 5) is None
+        assert cache.get_similar("drought", [1.0, 0.0], 5) is None
+
+    def test_expired_entries_miss(self):
+        cache = SemanticQueryCache(ttl_seconds=-1)
+        cache.put("drought", [1.0, 0.0], 10, make_response())
+
+        assert cache.get_similar("drought", [1.0, 0.0], 10) is None
+        assert cache.get_exact("drought", 10) is None
+
+    def test_lru_eviction(self):
+        cache = SemanticQueryCache(max_size=2)
+        cache.put("a", [1.0, 0.0], 10, make_response("a"))
+        cache.put("b", [0.0, 1.0], 10, make_response("b"))
+        cache.get_exact("a", 10)
+        cache.put("c", [-1.0, 0.0], 10, make_response("c"))
+
+        assert len(cache) == 2
+        assert cache.get_exact("b", 10) is None
+        assert cache.get_exact("a", 10) is not None
+
+    @pytest.mark.asyncio
+    async def test_service_reuses_cached_response(
+        self,
+        mock_vector_store,
+        mock_repository,
+        sample_semantic_results,
+    ):
+        mock_vector_store.search.return_value = sample_semantic_results
+        mock_vector_store.embedding_service.embed_query = AsyncMock(
+            return_value=[1.0, 0.0]
+        )
+        service = HybridSearchService(
+            vector_store=mock_vector_store,
+            repository=mock_repository,
+            cache=SemanticQueryCache(),
+        )
+
+        first = await service.search("uk drought data")
+        second = await service.search("UK drought data")
+
+        assert mock_vector_store.search.call_count == 1
+        assert mock_vector_store.search.call_args.kwargs["query_embedding"] == [1.0, 0.0]
+        assert [r.dataset_id for r in second.results] == [
+            r.dataset_id for r in first.results
+        ]
+
+    @pytest.mark.asyncio
+    async def test_similar_hit_is_rescored_for_new_query(
+        self,
+        mock_vector_store,
+        mock_repository,
+        sample_semantic_results,
+    ):
+        mock_vector_store.search.return_value = sample_semantic_results
+        mock_vector_store.embedding_service.embed_query = AsyncMock(
+            return_value=[1.0, 0.0]
+        )
+        service = HybridSearchService(
+            vector_store=mock_vector_store,
+            repository=mock_repository,
+            cache=SemanticQueryCache(),
+        )
+
+        await service.search("uk drought data records")
+        hit = await service.search("uk drought data")
+        fresh = await HybridSearchService(
+            vector_store=mock_vector_store,
+            repository=mock_repository,
+        ).search("uk drought data")
+
+        assert mock_vector_store.search.call_count == 2
+        assert hit.query == "uk drought data"
+        assert [(r.dataset_id, r.is_exact_match) for r in hit.results] == [
+            (r.dataset_id, r.is_exact_match) for r in fresh.results
+        ]
+        assert hit.results[0].is_exact_match
+        for a, b in zip(hit.results, fresh.results):
+            assert a.hybrid_score == pytest.approx(b.hybrid_score)
+
+    @pytest.mark.asyncio
+    async def test_similar_hit_requires_same_query_type(
+        self,
+        mock_vector_store,
+        mock_repository,
+        sample_semantic_results,
+    ):
+        mock_vector_store.search.return_value = sample_semantic_results
+        mock_vector_store.embedding_service.embed_query = AsyncMock(
+            return_value=[1.0, 0.0]
+        )
+        service = HybridSearchService(
+            vector_store=mock_vector_store,
+            repository=mock_repository,
+            cache=SemanticQueryCache(),
+        )
+
+        await service.search("uk drought data")
+        short = await service.search("uk drought")
+
+        assert mock_vector_store.search.call_count == 2
+        assert short.query_type == QueryType.SHORT
+
+
 # =============================================================================
 # Result Dataclass Tests
 # =============================================================================
@@ -366,6 +602,47 @@ class TestHybridSearchResult:
         assert result.from_keyword is True
 
 
+    def test_fast_constructors_match_init(
+        self, sample_semantic_results, sample_keyword_results
+    ):
+        """Test the merge's fast constructors set every field like __init__."""
+        semantic = sample_semantic_results[0]
+        dataset = sample_keyword_results[0]
+        
+        fast = [
+            HybridSearchResult._from_semantic(semantic, 0.1, 1),
+            HybridSearchResult._from_keyword(dataset, 0.2, 2),
+        ]
+        regular = [
+            HybridSearchResult(
+                dataset_id=semantic.dataset_id,
+                title=semantic.title,
+                abstract=semantic.abstract,
+                hybrid_score=0.1,
+                semantic_rank=1,
+                from_semantic=True,
+                keywords=semantic.keywords,
+                access_level=semantic.access_level,
+            ),
+            HybridSearchResult(
+                dataset_id=dataset.identifier,
+                title=dataset.title,
+                abstract=dataset.abstract,
+                hybrid_score=0.2,
+                keyword_rank=2,
+                from_keyword=True,
+                keywords=dataset.keywords,
+                organisation=dataset.organisation,
+                access_level=dataset.access_level,
+            ),
+        ]
+        
+        assert fast == regular
+        for result in fast:
+            for f in dataclasses.fields(HybridSearchResult):
+                assert hasattr(result, f.name), f.name
+
+
 class TestHybridSearchResponse:
     """Tests for response dataclass."""
     